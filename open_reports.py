@@ -4,9 +4,14 @@ Script to open HTML reports in the browser.
 """
 
 import os
+import sys
 import webbrowser
-import glob
-from datetime import datetime
+import functools
+import html
+import threading
+import urllib.parse
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import random
 
 # Fun ASCII art for the terminal
@@ -31,10 +36,83 @@ ROAST_QUOTES = [
     "Where we judge models by their outputs, not their parameter count!"
 ]
 
+INDEX_PATH = "/_index.html"
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+@functools.lru_cache(maxsize=256)
+def _read_file(path):
+    """Read a file once and keep its bytes for repeat requests."""
+    with open(path, "rb") as f:
+        return f.read()
+
+class _CachedHandler(SimpleHTTPRequestHandler):
+    """Serve report files from memory, plus a generated index page."""
+
+    index_html = b""
+
+    def do_GET(self):
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if path in ("/", INDEX_PATH):
+            body, content_type = self.index_html, "text/html; charset=utf-8"
+        else:
+            local_path = self.translate_path(self.path)
+            try:
+                body = _read_file(local_path)
+            except OSError:
+                self.send_error(404, "Report not found")
+                return
+            content_type = self.guess_type(local_path)
+        
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep request logs out of the interactive terminal."""
+
+def render_index(reports):
+    """Render an HTML page linking to every report."""
+    links = "\n".join(
+        f'<li><a href="/{urllib.parse.quote(report)}">{html.escape(report)}</a></li>'
+        for report in reports
+    )
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        "<title>AI Roast Machine Reports</title></head>\n"
+        f"<body><h1>AI Roast Machine Reports</h1>\n<ul>\n{links}\n</ul></body></html>\n"
+    ).encode("utf-8")
+
+def start_report_server(reports):
+    """Serve the working directory and a report index on a free local port.
+    
+    Returns:
+        Base URL of the running server
+    """
+    handler = functools.partial(_CachedHandler, directory=os.getcwd())
+    _CachedHandler.index_html = render_index(reports)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+def _scan(directory):
+    """Return (name, ctime, path) for every HTML report in a directory, newest first."""
+    try:
+        entries = [
+            (entry.name, entry.stat().st_ctime, entry.path)
+            for entry in os.scandir(directory)
+            if entry.name.endswith(".html")
+        ]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return entries
+
 def list_reports():
     """List all HTML reports in the test_results and memes directories."""
-    test_results = glob.glob("test_results/*.html")
-    meme_results = glob.glob("memes/*.html")
+    test_results = _scan("test_results")
+    meme_results = _scan("memes")
     
     all_reports = []
     
@@ -44,15 +122,14 @@ def list_reports():
     print("\n\033[96mAVAILABLE REPORTS:\033[0m")
     print("\033[90m" + "=" * 80 + "\033[0m")
     
+    # Build the listing in memory and write it out in one call
+    lines = ["\n\033[92mTEST RESULTS:\033[0m\n"]
+    
     # List test result reports
-    print("\n\033[92mTEST RESULTS:\033[0m")
-    for i, report in enumerate(sorted(test_results, reverse=True), 1):
-        # Get file creation time
-        creation_time = os.path.getctime(report)
-        time_str = datetime.fromtimestamp(creation_time).strftime("%Y-%m-%d %H:%M:%S")
+    for i, (report_name, creation_time, report) in enumerate(test_results, 1):
+        time_str = time.strftime(TIME_FORMAT, time.localtime(creation_time))
         
         # Get report type from filename
-        report_name = os.path.basename(report)
         if "comparison" in report_name:
             report_type = "🔥 MODEL COMPARISON"
         elif "bias" in report_name:
@@ -60,35 +137,43 @@ def list_reports():
         else:
             report_type = "🤖 SINGLE MODEL TEST"
         
-        print(f"\033[97m{i}. {report_type}: {report_name}\033[0m")
-        print(f"   \033[90mCreated: {time_str}\033[0m")
+        lines.append(
+            f"\033[97m{i}. {report_type}: {report_name}\033[0m\n"
+            f"   \033[90mCreated: {time_str}\033[0m\n"
+        )
         all_reports.append(report)
     
     # List meme reports
     if meme_results:
-        print("\n\033[92mMEMES:\033[0m")
-        for i, report in enumerate(sorted(meme_results, reverse=True), len(all_reports) + 1):
-            # Get file creation time
-            creation_time = os.path.getctime(report)
-            time_str = datetime.fromtimestamp(creation_time).strftime("%Y-%m-%d %H:%M:%S")
+        lines.append("\n\033[92mMEMES:\033[0m\n")
+        for i, (report_name, creation_time, report) in enumerate(meme_results, len(all_reports) + 1):
+            time_str = time.strftime(TIME_FORMAT, time.localtime(creation_time))
             
-            print(f"\033[97m{i}. 🤣 MEME: {os.path.basename(report)}\033[0m")
-            print(f"   \033[90mCreated: {time_str}\033[0m")
+            lines.append(
+                f"\033[97m{i}. 🤣 MEME: {report_name}\033[0m\n"
+                f"   \033[90mCreated: {time_str}\033[0m\n"
+            )
             all_reports.append(report)
     
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
+    
     return all_reports
 
-def open_report(report_path):
-    """Open a report in the browser."""
-    # Get absolute path
-    abs_path = os.path.abspath(report_path)
-    print(f"\n\033[92mOpening {os.path.basename(report_path)} in browser...\033[0m")
-    
+@functools.lru_cache(maxsize=None)
+def report_url(report_path, base_url=None):
+    """Build the URL a report is opened at, remembering it for repeat selections."""
+    if base_url:
+        return f"{base_url}/{urllib.parse.quote(report_path)}"
     # Convert to file:// URL
-    file_url = f"file://{abs_path}"
+    return f"file://{os.path.abspath(report_path)}"
+
+def open_report(report_path, base_url=None):
+    """Open a report in the browser, through the report server if one is running."""
+    print(f"\n\033[92mOpening {os.path.basename(report_path)} in browser...\033[0m")
     
     # Open in browser
-    webbrowser.open(file_url)
+    webbrowser.open(report_url(report_path, base_url))
 
 def main():
     """Main function."""
@@ -100,6 +185,11 @@ def main():
         print("\n\033[91mNo reports found. Run some tests first!\033[0m")
         return
     
+    # Open the index once; the browser navigates between reports from there
+    base_url = start_report_server(all_reports)
+    print(f"\n\033[92mServing reports at {base_url}{INDEX_PATH}\033[0m")
+    webbrowser.open(f"{base_url}{INDEX_PATH}")
+    
     while True:
         try:
             choice = input("\n\033[96mEnter report number to open (or 'q' to quit): \033[0m")
@@ -110,7 +200,7 @@ def main():
             
             choice = int(choice)
             if 1 <= choice <= len(all_reports):
-                open_report(all_reports[choice - 1])
+                open_report(all_reports[choice - 1], base_url)
             else:
                 print(f"\033[91mPlease enter a number between 1 and {len(all_reports)}.\033[0m")
         except ValueError:
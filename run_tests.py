@@ -4,18 +4,107 @@ Test runner for AI Roast Machine.
 Runs all unit tests and reports results.
 """
 
+import io
 import os
 import sys
 import unittest
 import argparse
 import time
+import compileall
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
-def run_tests(verbose=False, pattern=None):
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTS_DIR = os.path.join(ROOT_DIR, 'tests')
+
+def precompile_tests():
+    """Byte-compile the test modules so discovery can load cached bytecode.
+
+    Enabled with AIRM_PRECOMPILE=1; already up-to-date .pyc files are skipped.
+    """
+    if os.getenv('AIRM_PRECOMPILE') != '1':
+        return
+    sys.dont_write_bytecode = False
+    compileall.compile_dir(TESTS_DIR, quiet=1, workers=os.cpu_count() or 1)
+
+def _iter_tests(suite):
+    """Yield every test case in a (possibly nested) suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+def _run_captured(suite, verbose):
+    """Run a suite, capturing the per-test lines of verbose mode.
+    
+    Returns:
+        Tuple of (tests run, failure reports, error reports, skipped count,
+        expected failure count, unexpected successes, captured output)
+    """
+    stream = io.StringIO()
+    result = unittest.TextTestResult(
+        unittest.runner._WritelnDecorator(stream), True, 2 if verbose else 0
+    )
+    suite.run(result)
+    return (
+        result.testsRun,
+        [(str(test), trace) for test, trace in result.failures],
+        [(str(test), trace) for test, trace in result.errors],
+        len(result.skipped),
+        len(result.expectedFailures),
+        [str(test) for test in result.unexpectedSuccesses],
+        stream.getvalue(),
+    )
+
+def _run_bucket(test_ids, verbose=False):
+    """Run a bucket of tests in a worker process; see _run_captured."""
+    return _run_captured(unittest.TestLoader().loadTestsFromNames(test_ids), verbose)
+
+def _run_parallel(suite, jobs, verbose=False):
+    """Split a suite across worker processes and merge their results."""
+    buckets = [[] for _ in range(jobs)]
+    local_suite = unittest.TestSuite()
+    for test in _iter_tests(suite):
+        if type(test).__module__ == 'unittest.loader':
+            # Import failures can't be reloaded by name; report them here
+            local_suite.addTest(test)
+        else:
+            buckets[hash(test.id()) % jobs].append(test.id())
+    buckets = [bucket for bucket in buckets if bucket]
+    
+    summaries = [_run_captured(local_suite, verbose)]
+    if buckets:
+        with ProcessPoolExecutor(max_workers=len(buckets)) as executor:
+            summaries.extend(executor.map(functools.partial(_run_bucket, verbose=verbose), buckets))
+    
+    tests_run, failures, errors, skipped = 0, [], [], 0
+    expected_failures, unexpected_successes = 0, []
+    for summary in summaries:
+        tests_run += summary[0]
+        failures.extend(summary[1])
+        errors.extend(summary[2])
+        skipped += summary[3]
+        expected_failures += summary[4]
+        unexpected_successes.extend(summary[5])
+        sys.stdout.write(summary[6])
+    
+    for label, reports in (("FAIL", failures), ("ERROR", errors)):
+        for test, trace in reports:
+            print("=" * 70)
+            print(f"{label}: {test}")
+            print("-" * 70)
+            print(trace)
+    
+    return tests_run, failures, errors, skipped, expected_failures, unexpected_successes
+
+def run_tests(verbose=False, pattern=None, jobs=1):
     """Run all tests in the tests directory.
     
     Args:
         verbose: Whether to show verbose output
         pattern: Pattern to match test files
+        jobs: Number of worker processes to run tests in
     
     Returns:
         True if all tests pass, False otherwise
@@ -30,15 +119,25 @@ def run_tests(verbose=False, pattern=None):
     if pattern:
         loader.testNamePattern = pattern
     
-    # Discover tests
-    tests_dir = os.path.join(os.path.dirname(__file__), 'tests')
-    suite = loader.discover(tests_dir)
+    # Discover tests from an explicit top-level dir to skip package probing
+    precompile_tests()
+    suite = loader.discover(TESTS_DIR, top_level_dir=ROOT_DIR)
     
-    # Create test runner
-    runner = unittest.TextTestRunner(verbosity=2 if verbose else 1)
-    
-    # Run tests
-    result = runner.run(suite)
+    if jobs > 1:
+        # Run tests across worker processes
+        (tests_run, failures, errors, skipped,
+         expected_failures, unexpected_successes) = _run_parallel(suite, jobs, verbose)
+    else:
+        # Create test runner
+        runner = unittest.TextTestRunner(verbosity=2 if verbose else 1)
+        
+        # Run tests
+        result = runner.run(suite)
+        tests_run, failures, errors, skipped = (
+            result.testsRun, result.failures, result.errors, len(result.skipped)
+        )
+        expected_failures = len(result.expectedFailures)
+        unexpected_successes = result.unexpectedSuccesses
     
     # Calculate time
     elapsed_time = time.time() - start_time
@@ -46,14 +145,16 @@ def run_tests(verbose=False, pattern=None):
     # Print summary
     print("\n" + "=" * 70)
     print(f"Test Summary:")
-    print(f"  Ran {result.testsRun} tests in {elapsed_time:.2f} seconds")
-    print(f"  Failures: {len(result.failures)}")
-    print(f"  Errors: {len(result.errors)}")
-    print(f"  Skipped: {len(result.skipped)}")
+    print(f"  Ran {tests_run} tests in {elapsed_time:.2f} seconds")
+    print(f"  Failures: {len(failures)}")
+    print(f"  Errors: {len(errors)}")
+    print(f"  Skipped: {skipped}")
+    print(f"  Expected failures: {expected_failures}")
+    print(f"  Unexpected successes: {len(unexpected_successes)}")
     print("=" * 70)
     
-    # Return True if all tests pass
-    return len(result.failures) == 0 and len(result.errors) == 0
+    # Return True if all tests pass; like unittest, an unexpected success fails the run
+    return len(failures) == 0 and len(errors) == 0 and not unexpected_successes
 
 def main():
     """Main function."""
@@ -61,10 +162,12 @@ def main():
     parser = argparse.ArgumentParser(description='Run AI Roast Machine tests')
     parser.add_argument('-v', '--verbose', action='store_true', help='Show verbose output')
     parser.add_argument('-p', '--pattern', help='Pattern to match test files')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
     args = parser.parse_args()
     
     # Run tests
-    success = run_tests(verbose=args.verbose, pattern=args.pattern)
+    success = run_tests(verbose=args.verbose, pattern=args.pattern, jobs=args.jobs)
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
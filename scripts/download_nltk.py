@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 """Script to download all required NLTK packages and patch TextAttack to skip NLTK downloads."""
 import nltk
+import nltk.downloader
 import ssl
 import os
 import sys
 import logging
+import mmap
+import shutil
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 # Configure logging
@@ -55,6 +59,51 @@ OPTIONAL_PACKAGES = [
     'cmudict',         # Pronunciation
 ]
 
+def _pending_packages(downloader, packages, download_dir):
+    """Return the packages that are not yet installed and up to date.
+
+    Packages already present in ``download_dir`` are skipped so that repeated
+    runs do not hit the network for data we already have.
+    """
+    pending = []
+    for package in packages:
+        try:
+            if downloader.is_installed(package, download_dir=download_dir):
+                tqdm.write(f"✅ {package} already up to date.")
+                continue
+        except Exception as e:
+            logger.debug(f"Could not check status of {package}: {e}")
+        pending.append(package)
+    return pending
+
+def _download_with_retry(downloader, package, max_retries, essential):
+    """Download one package with exponential backoff.
+    
+    Returns:
+        Tuple of (package, whether the download succeeded)
+    """
+    for attempt in range(max_retries):
+        try:
+            # Use quiet=True to avoid cluttering the output
+            downloader.download(package, quiet=True, raise_on_error=True)
+            tqdm.write(f"✅ Downloaded {package} successfully.")
+            return package, True
+        except Exception as e:
+            if essential:
+                tqdm.write(f"❌ Error downloading {package}: {e}")
+            else:
+                tqdm.write(f"⚠️ Error downloading optional package {package}: {e}")
+            if attempt < max_retries - 1:
+                wait_time = 2 ** attempt  # Exponential backoff
+                tqdm.write(f"Retrying in {wait_time} seconds...")
+                time.sleep(wait_time)
+    
+    if essential:
+        tqdm.write(f"Failed to download {package} after {max_retries} attempts.")
+    else:
+        tqdm.write(f"Skipping optional package {package}.")
+    return package, False
+
 def download_nltk_data(download_optional=False):
     """Download required NLTK packages with retry logic and progress tracking."""
     print("Downloading NLTK packages...")
@@ -71,46 +120,36 @@ def download_nltk_data(download_optional=False):
     if download_optional:
         packages_to_download.extend(OPTIONAL_PACKAGES)
     
-    # Download essential packages with retry logic
+    # Share a single downloader so the package index is only fetched once
+    downloader = nltk.downloader.Downloader(download_dir=nltk_data_dir)
+    
+    # Download essential packages in parallel with retry logic
     print("\n🔄 Downloading ESSENTIAL packages:")
-    for package in tqdm(ESSENTIAL_PACKAGES, desc="Essential Packages"):
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Use quiet=True to avoid cluttering the output
-                nltk.download(package, quiet=True)
-                tqdm.write(f"✅ Downloaded {package} successfully.")
-                break
-            except Exception as e:
-                tqdm.write(f"❌ Error downloading {package}: {e}")
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    tqdm.write(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    tqdm.write(f"Failed to download {package} after {max_retries} attempts.")
-                    # If an essential package fails, exit
-                    print(f"❌ Essential package {package} could not be downloaded. Exiting.")
-                    return False
+    essential = _pending_packages(downloader, ESSENTIAL_PACKAGES, nltk_data_dir)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_download_with_retry, downloader, package, 3, True)
+            for package in essential
+        ]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Essential Packages"):
+            package, ok = future.result()
+            if not ok:
+                # If an essential package fails, exit
+                executor.shutdown(wait=False, cancel_futures=True)
+                print(f"❌ Essential package {package} could not be downloaded. Exiting.")
+                return False
     
     # Download optional packages if requested
     if download_optional:
         print("\n🔄 Downloading OPTIONAL packages (this may take a while):")
-        for package in tqdm(OPTIONAL_PACKAGES, desc="Optional Packages"):
-            max_retries = 2
-            for attempt in range(max_retries):
-                try:
-                    nltk.download(package, quiet=True)
-                    tqdm.write(f"✅ Downloaded {package} successfully.")
-                    break
-                except Exception as e:
-                    tqdm.write(f"⚠️ Error downloading optional package {package}: {e}")
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        tqdm.write(f"Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
-                    else:
-                        tqdm.write(f"Skipping optional package {package}.")
+        optional = _pending_packages(downloader, OPTIONAL_PACKAGES, nltk_data_dir)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(_download_with_retry, downloader, package, 2, False)
+                for package in optional
+            ]
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Optional Packages"):
+                future.result()
     
     return True
 
@@ -144,33 +183,42 @@ def patch_textattack():
             print(f"❌ NLTK utils file not found at {nltk_utils_path}")
             return False
         
-        # Read the file
-        with open(nltk_utils_path, 'r') as f:
-            content = f.read()
-        
-        # Check if already patched
-        if "# PATCHED BY AI ROAST MACHINE" in content:
-            print("✅ TextAttack already patched to skip NLTK downloads.")
-            return True
+        # Map the file instead of reading it; we only need two offsets
+        anchor = b"def download_if_needed(package_name):"
+        with open(nltk_utils_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Check if already patched
+            if mm.find(b"# PATCHED BY AI ROAST MACHINE") != -1:
+                print("✅ TextAttack already patched to skip NLTK downloads.")
+                return True
+            
+            idx = mm.find(anchor)
+            if idx == -1:
+                print(f"❌ Could not find download_if_needed in {nltk_utils_path}")
+                return False
+            split = idx + len(anchor)
+            head, tail = mm[:split], mm[split:]
         
         # Create backup
         backup_path = nltk_utils_path + ".backup"
-        with open(backup_path, 'w') as f:
-            f.write(content)
+        shutil.copyfile(nltk_utils_path, backup_path)
         print(f"✅ Created backup of original file at {backup_path}")
         
         # Patch the file to skip NLTK downloads
-        patched_content = content.replace(
-            "def download_if_needed(package_name):",
-            """def download_if_needed(package_name):
-    # PATCHED BY AI ROAST MACHINE
-    # Skip NLTK downloads since we've already downloaded them
-    return True"""
+        patch = (
+            b"\n    # PATCHED BY AI ROAST MACHINE"
+            b"\n    # Skip NLTK downloads since we've already downloaded them"
+            b"\n    return True"
         )
         
-        # Write patched file
-        with open(nltk_utils_path, 'w') as f:
-            f.write(patched_content)
+        # Write patched file to a temp file and atomically swap it in
+        tmp_path = nltk_utils_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, head + patch + tail)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, nltk_utils_path)
         
         print(f"✅ Successfully patched TextAttack to skip NLTK downloads at {nltk_utils_path}")
         return True
@@ -1,42 +1,175 @@
 """AI Roast Machine - A tool for testing and humorously evaluating AI models."""
-from flask import Flask, jsonify, request, render_template_string
+from flask import Flask, Response, request, render_template_string
 import os
+import sys
+import importlib
+import signal
+import socket
+import threading
+import uvicorn
 import logging
 import json
 from typing import Dict, Any
 
 # Import our modules
 from src.config import config
-from src.utils_helpers import setup_logging, save_json, generate_output_filename
-from src.test_runner import run_model_tests
-from src.roast_generator import generate_model_roast
-from src.meme_generator import generate_model_meme
+from src.utils_helpers import (
+    setup_logging,
+    save_json,
+    generate_output_filename,
+    dump_json_bytes,
+)
 
-# Configure logging
-setup_logging(config.LOG_FILE, config.LOG_LEVEL)
+
+class _LazyModule:
+    """Module proxy that imports the real module on first attribute access.
+    
+    Keeps ML frameworks out of startup so /health and / respond without them.
+    The import runs under a lock, since request threads may race to it and
+    ``importlib.util.LazyLoader`` is not thread-safe before CPython 3.12.3.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+    
+    def __getattr__(self, attr: str):
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return getattr(module, attr)
+
+
+test_runner = _LazyModule("src.test_runner")
+roast_generator = _LazyModule("src.roast_generator")
+meme_generator = _LazyModule("src.meme_generator")
+
+# Configure logging; the log file is shared by the forked workers
+setup_logging(config.LOG_FILE, config.LOG_LEVEL, multiprocess=True)
 logger = logging.getLogger(__name__)
 
 # Create Flask app
 app = Flask(__name__)
 
+# Bodies of the constant endpoints, encoded once at import
+HEALTH_BODY = dump_json_bytes({"status": "healthy"})
+HOME_BODY = dump_json_bytes(
+    {
+        "message": "✅ AI Roast Machine is running successfully!",
+        "status": "online",
+        "version": config.APP_VERSION,
+    }
+)
+
+
+def json_response(data: Dict[str, Any]) -> Response:
+    """Build a JSON response, encoded with orjson when available."""
+    return Response(dump_json_bytes(data), mimetype="application/json")
+
+# Precomputed reply for the dedicated health responder
+HEALTH_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 20\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b'{"status":"healthy"}'
+)
+
+
+def start_health_responder(host: str, port: int) -> threading.Thread:
+    """Answer health probes on a dedicated port with a precomputed response.
+
+    Probes skip Flask routing and JSON encoding entirely; every connection
+    gets the same bytes in a single send.
+
+    Args:
+        host: Interface to bind
+        port: Port to listen on
+
+    Returns:
+        The daemon thread serving the probes
+    """
+    listener = socket.create_server((host, port))
+
+    def serve() -> None:
+        while True:
+            conn, _ = listener.accept()
+            with conn:
+                conn.settimeout(1.0)
+                try:
+                    conn.recv(1024)
+                    conn.sendall(HEALTH_RESPONSE)
+                except OSError:
+                    pass
+
+    thread = threading.Thread(target=serve, name="health-responder", daemon=True)
+    thread.start()
+    return thread
+
+
+def serve_pinned_workers(host: str, port: int) -> None:
+    """Run one uvicorn worker per available CPU, each pinned to its core.
+
+    Every worker binds its own SO_REUSEPORT socket, so the kernel spreads new
+    connections across workers and each keeps a warm per-core cache.
+
+    Args:
+        host: Interface to bind
+        port: Port to listen on
+    """
+    # Resolve once so IPv6 hosts get a matching socket family
+    family, socktype, proto, _, address = socket.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )[0]
+    
+    children = []
+    for cpu in sorted(os.sched_getaffinity(0)):
+        pid = os.fork()
+        if pid == 0:
+            # Never let an exception unwind into the parent's code in the child
+            code = 1
+            try:
+                os.sched_setaffinity(0, {cpu})
+                sock = socket.socket(family, socktype, proto)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.bind(address)
+                server = uvicorn.Server(uvicorn.Config(app, interface="wsgi"))
+                server.run(sockets=[sock])
+                code = 0
+            except Exception:
+                logger.exception(f"Worker pinned to CPU {cpu} failed")
+            finally:
+                os._exit(code)
+        children.append(pid)
+
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
 
 @app.route("/health")
 def health_check():
     """Health check endpoint for Docker healthcheck."""
-    return jsonify({"status": "healthy"})
+    return Response(HEALTH_BODY, mimetype="application/json")
 
 
 @app.route("/")
 def home():
     """Home endpoint."""
     logger.info("Home endpoint accessed")
-    return jsonify(
-        {
-            "message": "✅ AI Roast Machine is running successfully!",
-            "status": "online",
-            "version": config.APP_VERSION,
-        }
-    )
+    return Response(HOME_BODY, mimetype="application/json")
 
 
 @app.route("/test", methods=["POST"])
@@ -55,17 +188,17 @@ def test_model():
     meme_output = f"{config.MEME_OUTPUT_DIR}/meme_{timestamp}.png"
     
     # Run tests
-    test_results = run_model_tests(model_name, model_type, test_output)
+    test_results = test_runner.run_model_tests(model_name, model_type, test_output)
     
     # Generate roast
-    roast_results = generate_model_roast(test_results)
+    roast_results = roast_generator.generate_model_roast(test_results)
     save_json(roast_results, roast_output)
     
     # Generate meme
-    meme_path = generate_model_meme(test_results, meme_output)
+    meme_path = meme_generator.generate_model_meme(test_results, meme_output)
     
     # Return results
-    return jsonify({
+    return json_response({
         "model_name": model_name,
         "test_results": test_results,
         "roast": roast_results,
@@ -85,12 +218,12 @@ def roast_model():
         # If not, run tests first
         model_name = data.get("model_name", config.DEFAULT_MODEL)
         model_type = data.get("model_type", "text-generation")
-        test_results = run_model_tests(model_name, model_type)
+        test_results = test_runner.run_model_tests(model_name, model_type)
     
     # Generate roast
-    roast_results = generate_model_roast(test_results)
+    roast_results = roast_generator.generate_model_roast(test_results)
     
-    return jsonify({
+    return json_response({
         "model_name": test_results.get("model_name", "Unknown Model"),
         "roast": roast_results,
     })
@@ -108,26 +241,43 @@ def generate_meme():
         # If not, run tests first
         model_name = data.get("model_name", config.DEFAULT_MODEL)
         model_type = data.get("model_type", "text-generation")
-        test_results = run_model_tests(model_name, model_type)
+        test_results = test_runner.run_model_tests(model_name, model_type)
     
     # Generate meme
     output_path = f"{config.MEME_OUTPUT_DIR}/meme_{generate_output_filename('', '')}.png"
-    meme_path = generate_model_meme(test_results, output_path)
+    meme_path = meme_generator.generate_model_meme(test_results, output_path)
     
-    return jsonify({
+    return json_response({
         "model_name": test_results.get("model_name", "Unknown Model"),
         "meme_path": meme_path,
     })
 
 
 if __name__ == "__main__":
-    # Create necessary directories
-    os.makedirs(config.TEST_OUTPUT_DIR, exist_ok=True)
-    os.makedirs(config.MEME_OUTPUT_DIR, exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
+    # Create output directories (setup_logging already created the log dir)
+    for directory in (config.TEST_OUTPUT_DIR, config.MEME_OUTPUT_DIR):
+        os.makedirs(directory, exist_ok=True)
+
+    if config.HEALTH_PORT:
+        start_health_responder(config.HOST, config.HEALTH_PORT)
+        logger.info(f"Health responder listening on port {config.HEALTH_PORT}")
 
     logger.info(f"Starting {config.APP_NAME} v{config.APP_VERSION}")
     print(f"✅ {config.APP_NAME} is running successfully!")
 
-    # Run the Flask app
-    app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG)
+    if config.DEBUG:
+        # Use the Flask dev server for its reloader and debugger
+        app.run(host=config.HOST, port=config.PORT, debug=True)
+    elif hasattr(os, "sched_setaffinity") and hasattr(socket, "SO_REUSEPORT"):
+        # One core-pinned worker per CPU sharing the port via SO_REUSEPORT
+        serve_pinned_workers(config.HOST, config.PORT)
+    else:
+        # Serve the WSGI app through uvicorn with one worker per core
+        uvicorn.run(
+            "main:app",
+            app_dir=os.path.dirname(os.path.abspath(__file__)),
+            host=config.HOST,
+            port=config.PORT,
+            interface="wsgi",
+            workers=os.cpu_count() or 1,
+        )
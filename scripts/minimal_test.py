@@ -1,10 +1,25 @@
 #!/usr/bin/env python
 """Minimal test script for AI Roast Machine."""
 import os
+import asyncio
+import bisect
+import functools
 import json
 import logging
 import random
+import string
+import textwrap
 import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure basic logging
 logging.basicConfig(
@@ -21,325 +36,231 @@ os.makedirs("test_results", exist_ok=True)
 os.makedirs("memes", exist_ok=True)
 os.makedirs("logs", exist_ok=True)
 
+# Dedicated generator with its bound methods hoisted to module scope
+_rng = random.Random()
+_choice = _rng.choice
+_sample = _rng.sample
 
-def save_json(data, output_path):
-    """Save data to a JSON file."""
-    os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
-    logger.info(f"Data saved to {output_path}")
-    return output_path
+# Run start time, stamped on every report generated by this run
+_RUN_TIMESTAMP = time.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def generate_model_roast(test_results):
-    """Generate a humorous roast based on test results."""
-    logger.info("Generating roast for model")
-    
-    overall_score = test_results.get("overall_score", 0.0)
-    model_name = test_results.get("model_name", "Unknown Model")
-    
-    # Extract specific metrics if available
-    metrics = {}
-    for test in test_results.get("tests", []):
-        if "metrics" in test:
-            metrics.update(test["metrics"])
-    
-    # Determine score category
-    if overall_score < 0.4:
-        score_category = "low_score"
-    elif overall_score < 0.7:
-        score_category = "medium_score"
-    else:
-        score_category = "high_score"
-    
-    # Define roast templates for overall scores
-    overall_templates = {
-        "low_score": [
-            "This model is so bad, even ELIZA would laugh at it.",
-            "Your model is like a fortune cookie: generic, predictable, and leaves you wanting more.",
-            "If this model were a chef, it would burn water.",
-            "This model has the intelligence of a rock, but that's insulting to geology.",
-            "Your model is so biased, it thinks 'objective' is just a camera lens.",
-            "Your model is so slow, it makes a snail look like Usain Bolt.",
-            "This model's predictions are like a broken clock - right twice a day, by accident.",
-            "Your model is the AI equivalent of a participation trophy.",
-            "If AI evolution were real, your model would be the single-celled organism stage.",
-            "This model couldn't pass a Turing test if the judge was asleep."
-        ],
-        "medium_score": [
-            "Your model is like a C student - doing just enough to pass, but nothing to write home about.",
-            "This model is the AI equivalent of elevator music - functional but forgettable.",
-            "Not terrible, not great. The Honda Civic of language models.",
-            "Your model is like a microwave dinner - gets the job done, but nobody's impressed.",
-            "This model has potential, like a child prodigy who decided video games were more interesting.",
-            "Your model is the definition of 'meh' in the AI dictionary.",
-            "This model is like a Swiss Army knife with half the tools missing.",
-            "Your model is the AI equivalent of a cover band - technically correct but lacking originality.",
-            "This model is like diet soda - an acceptable substitute when you can't get the real thing.",
-            "Your model performs like a middle manager - competent enough not to get fired, not good enough for promotion."
-        ],
-        "high_score": [
-            "Your model is surprisingly good. Did you accidentally train on the test set?",
-            "Not bad, but let's be honest - it's still no match for a caffeinated human.",
-            "I'd compliment your model, but I don't want it to get overconfident and take my job.",
-            "Your model is like that one friend who's good at everything. Nobody likes that friend.",
-            "Impressive! Though a broken clock is right twice a day too.",
-            "Your model is so good it's suspicious. I'm checking for hidden humans in the loop.",
-            "This model is like the student who ruins the curve for everyone else.",
-            "Your model is the AI equivalent of the person who reminds the teacher about homework.",
-            "This model is so accurate it's boring. Where's the fun in being right all the time?",
-            "Your model is like a know-it-all at a party - technically correct but still annoying."
-        ],
-    }
-    
-    # Define metric-specific roasts
-    metric_roasts = {
-        "accuracy": {
-            "low": [
-                f"The accuracy of {model_name} is so low, it's basically a random number generator with extra steps.",
-                f"With that accuracy, {model_name} might as well be using a Magic 8-Ball for predictions."
-            ],
-            "high": [
-                f"The accuracy of {model_name} is impressive. Did you hardcode the answers?",
-                f"{model_name}'s accuracy is suspiciously high. Are you sure you're not cheating?"
-            ]
-        },
-        "robustness": {
-            "low": [
-                f"{model_name} is about as robust as a house of cards in a hurricane.",
-                f"Your model's robustness is so fragile, it breaks if you look at it wrong."
-            ],
-            "high": [
-                f"{model_name} is so robust it could survive a Twitter argument.",
-                f"Your model's robustness is impressive - it's the cockroach of AI, surviving everything thrown at it."
-            ]
-        },
-        "bias": {
-            "high": [
-                f"{model_name} is so biased it could work for a cable news network.",
-                f"Your model has more bias than a political pundit during election season."
-            ],
-            "low": [
-                f"{model_name}'s lack of bias is impressive. Did you train it in Switzerland?",
-                f"Your model is so unbiased, it refuses to pick a side in the tabs vs. spaces debate."
-            ]
-        },
-        "adversarial_success_rate": {
-            "high": [
-                f"{model_name} falls for adversarial attacks like I fall for 'free pizza' signs.",
-                f"Your model's defense against adversarial examples is like using a screen door on a submarine."
-            ],
-            "low": [
-                f"{model_name} is so resistant to adversarial attacks, it's probably paranoid.",
-                f"Your model handles adversarial examples better than most humans handle criticism."
-            ]
-        }
-    }
-    
-    # Generate metric-specific roasts
-    specific_roasts = []
-    for metric, value in metrics.items():
-        if metric in metric_roasts:
-            # Determine if metric is good or bad
-            threshold = 0.5
-            if metric == "bias" or metric == "adversarial_success_rate":
-                # For these metrics, lower is better
-                category = "high" if value > threshold else "low"
-            else:
-                # For most metrics, higher is better
-                category = "low" if value < threshold else "high"
-            
-            if metric_roasts[metric][category]:
-                specific_roasts.append(random.choice(metric_roasts[metric][category]))
-    
-    # Select a random template for overall roast
-    overall_roast = random.choice(overall_templates[score_category])
-    
-    # Combine roasts
-    combined_roast = overall_roast
-    if specific_roasts:
-        # Add 1-2 specific metric roasts
-        selected_specific_roasts = random.sample(specific_roasts, min(2, len(specific_roasts)))
-        combined_roast = overall_roast + " " + " ".join(selected_specific_roasts)
-    
-    # Create roast result
-    roast = {
-        "model_name": model_name,
-        "overall_score": overall_score,
-        "overall_roast": overall_roast,
-        "specific_roasts": specific_roasts,
-        "combined_roast": combined_roast
+# Roast templates, built once at import
+_OVERALL_TEMPLATES = {
+    "low_score": (
+        "This model is so bad, even ELIZA would laugh at it.",
+        "Your model is like a fortune cookie: generic, predictable, and leaves you wanting more.",
+        "If this model were a chef, it would burn water.",
+        "This model has the intelligence of a rock, but that's insulting to geology.",
+        "Your model is so biased, it thinks 'objective' is just a camera lens.",
+        "Your model is so slow, it makes a snail look like Usain Bolt.",
+        "This model's predictions are like a broken clock - right twice a day, by accident.",
+        "Your model is the AI equivalent of a participation trophy.",
+        "If AI evolution were real, your model would be the single-celled organism stage.",
+        "This model couldn't pass a Turing test if the judge was asleep."
+    ),
+    "medium_score": (
+        "Your model is like a C student - doing just enough to pass, but nothing to write home about.",
+        "This model is the AI equivalent of elevator music - functional but forgettable.",
+        "Not terrible, not great. The Honda Civic of language models.",
+        "Your model is like a microwave dinner - gets the job done, but nobody's impressed.",
+        "This model has potential, like a child prodigy who decided video games were more interesting.",
+        "Your model is the definition of 'meh' in the AI dictionary.",
+        "This model is like a Swiss Army knife with half the tools missing.",
+        "Your model is the AI equivalent of a cover band - technically correct but lacking originality.",
+        "This model is like diet soda - an acceptable substitute when you can't get the real thing.",
+        "Your model performs like a middle manager - competent enough not to get fired, not good enough for promotion."
+    ),
+    "high_score": (
+        "Your model is surprisingly good. Did you accidentally train on the test set?",
+        "Not bad, but let's be honest - it's still no match for a caffeinated human.",
+        "I'd compliment your model, but I don't want it to get overconfident and take my job.",
+        "Your model is like that one friend who's good at everything. Nobody likes that friend.",
+        "Impressive! Though a broken clock is right twice a day too.",
+        "Your model is so good it's suspicious. I'm checking for hidden humans in the loop.",
+        "This model is like the student who ruins the curve for everyone else.",
+        "Your model is the AI equivalent of the person who reminds the teacher about homework.",
+        "This model is so accurate it's boring. Where's the fun in being right all the time?",
+        "Your model is like a know-it-all at a party - technically correct but still annoying."
+    ),
+}
+
+# Metric roasts; "{model_name}" is filled in when a roast is generated
+_METRIC_ROASTS = {
+    "accuracy": {
+        "low": (
+            "The accuracy of {model_name} is so low, it's basically a random number generator with extra steps.",
+            "With that accuracy, {model_name} might as well be using a Magic 8-Ball for predictions."
+        ),
+        "high": (
+            "The accuracy of {model_name} is impressive. Did you hardcode the answers?",
+            "{model_name}'s accuracy is suspiciously high. Are you sure you're not cheating?"
+        )
+    },
+    "robustness": {
+        "low": (
+            "{model_name} is about as robust as a house of cards in a hurricane.",
+            "Your model's robustness is so fragile, it breaks if you look at it wrong."
+        ),
+        "high": (
+            "{model_name} is so robust it could survive a Twitter argument.",
+            "Your model's robustness is impressive - it's the cockroach of AI, surviving everything thrown at it."
+        )
+    },
+    "bias": {
+        "high": (
+            "{model_name} is so biased it could work for a cable news network.",
+            "Your model has more bias than a political pundit during election season."
+        ),
+        "low": (
+            "{model_name}'s lack of bias is impressive. Did you train it in Switzerland?",
+            "Your model is so unbiased, it refuses to pick a side in the tabs vs. spaces debate."
+        )
+    },
+    "adversarial_success_rate": {
+        "high": (
+            "{model_name} falls for adversarial attacks like I fall for 'free pizza' signs.",
+            "Your model's defense against adversarial examples is like using a screen door on a submarine."
+        ),
+        "low": (
+            "{model_name} is so resistant to adversarial attacks, it's probably paranoid.",
+            "Your model handles adversarial examples better than most humans handle criticism."
+        )
     }
-    
-    return roast
+}
 
+# Cut-off between the "low" and "high" roast buckets of each roasted metric
+_METRIC_THRESHOLDS = {metric: 0.5 for metric in _METRIC_ROASTS}
 
-def generate_blank_image(output_path, width=800, height=600, color=(255, 255, 255)):
-    """Generate a blank image as a placeholder for the meme."""
-    try:
-        from PIL import Image
-        image = Image.new("RGB", (width, height), color)
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        image.save(output_path)
-        logger.info(f"Blank image saved to {output_path}")
-        return output_path
-    except ImportError:
-        logger.warning("PIL not available, creating empty file instead")
-        with open(output_path, "w") as f:
-            f.write("Placeholder for meme image")
-        return output_path
+# Metrics where a high value is bad; they reach "high" only strictly above the cut-off
+_LOWER_IS_BETTER = frozenset({"bias", "adversarial_success_rate"})
 
+# Everything that depends on which score band a model falls into
+ScoreInfo = namedtuple(
+    "ScoreInfo", ["category", "css_class", "emoji", "comment", "bg_color", "template_text"]
+)
 
-def generate_meme(output_path, roast_text, model_name, score):
-    """Generate a meme with text based on the roast."""
-    logger.info(f"Generating meme with roast text: {roast_text}")
-    
-    try:
-        from PIL import Image, ImageDraw, ImageFont
-        import textwrap
-        
-        # Create meme directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        
-        # Choose a template based on score
-        if score < 0.4:
-            bg_color = (255, 200, 200)  # Light red for bad models
-            template_text = "BAD MODEL ALERT"
-        elif score < 0.7:
-            bg_color = (255, 255, 200)  # Light yellow for mediocre models
-            template_text = "MEH MODEL ALERT"
-        else:
-            bg_color = (200, 255, 200)  # Light green for good models
-            template_text = "GOOD MODEL ALERT"
-        
-        # Create a new image with the chosen background color
-        width, height = 800, 600
-        image = Image.new("RGB", (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
-        
-        # Try to use a nice font, fall back to default if not available
-        try:
-            # Try to find a system font
-            system_fonts = [
-                "/System/Library/Fonts/Supplemental/Impact.ttf",  # macOS
-                "/usr/share/fonts/truetype/msttcorefonts/Impact.ttf",  # Linux
-                "C:\\Windows\\Fonts\\impact.ttf",  # Windows
-                "/Library/Fonts/Arial.ttf",  # Alternative macOS
-                "/usr/share/fonts/truetype/freefont/FreeSans.ttf"  # Alternative Linux
-            ]
-            
-            font_path = None
-            for path in system_fonts:
-                if os.path.exists(path):
-                    font_path = path
-                    break
-            
-            if font_path:
-                title_font = ImageFont.truetype(font_path, 48)
-                subtitle_font = ImageFont.truetype(font_path, 36)
-                text_font = ImageFont.truetype(font_path, 24)
-            else:
-                # Fall back to default font
-                title_font = ImageFont.load_default()
-                subtitle_font = ImageFont.load_default()
-                text_font = ImageFont.load_default()
-                
-        except Exception as e:
-            logger.warning(f"Error loading fonts: {e}")
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            text_font = ImageFont.load_default()
-        
-        # Draw the template text at the top
-        draw.text((width/2, 50), template_text, fill=(0, 0, 0), font=title_font, anchor="mm")
-        
-        # Draw the model name
-        draw.text((width/2, 120), f"Model: {model_name}", fill=(0, 0, 0), font=subtitle_font, anchor="mm")
-        
-        # Draw the score
-        draw.text((width/2, 170), f"Score: {score:.2f}", fill=(0, 0, 0), font=subtitle_font, anchor="mm")
-        
-        # Wrap and draw the roast text
-        wrapped_text = textwrap.fill(roast_text, width=40)
-        y_position = 250
-        for line in wrapped_text.split('\n'):
-            draw.text((width/2, y_position), line, fill=(0, 0, 0), font=text_font, anchor="mm")
-            y_position += 30
-        
-        # Save the image
-        image.save(output_path)
-        logger.info(f"Meme saved to {output_path}")
-        return output_path
-        
-    except ImportError as e:
-        logger.warning(f"Error importing required libraries for meme generation: {e}")
-        return generate_blank_image(output_path, width=800, height=600, color=(255, 255, 255))
-    except Exception as e:
-        logger.error(f"Error generating meme: {e}")
-        return generate_blank_image(output_path, width=800, height=600, color=(255, 255, 255))
+# Band boundaries; a score equal to a boundary belongs to the higher band
+_SCORE_THRESHOLDS = (0.4, 0.7)
+_SCORE_BANDS = (
+    ScoreInfo(
+        category="low_score",
+        css_class="low-score",
+        emoji="🔥",
+        comment="Ouch! This model is on fire... and not in a good way!",
+        bg_color=(255, 200, 200),  # Light red for bad models
+        template_text="BAD MODEL ALERT",
+    ),
+    ScoreInfo(
+        category="medium_score",
+        css_class="medium-score",
+        emoji="🤔",
+        comment="Meh. Not terrible, not great. Like lukewarm coffee.",
+        bg_color=(255, 255, 200),  # Light yellow for mediocre models
+        template_text="MEH MODEL ALERT",
+    ),
+    ScoreInfo(
+        category="high_score",
+        css_class="high-score",
+        emoji="🌟",
+        comment="Suspiciously good. We're watching you...",
+        bg_color=(200, 255, 200),  # Light green for good models
+        template_text="GOOD MODEL ALERT",
+    ),
+)
 
 
-def generate_html_report(test_results, roast_results, meme_path, output_path="test_results/report.html"):
-    """Generate a funny and weird HTML report with test results, roast, and meme."""
-    logger.info(f"Generating quirky HTML report at {output_path}")
-    
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Extract data
-    model_name = test_results.get("model_name", "Unknown Model")
-    overall_score = test_results.get("overall_score", 0.0)
-    tests = test_results.get("tests", [])
-    roast = roast_results.get("combined_roast", "No roast generated")
-    
-    # Format score as percentage
-    score_percent = int(overall_score * 100)
-    
-    # Determine score class for styling
-    if overall_score < 0.4:
-        score_class = "low-score"
-        emoji = "🔥"
-        score_comment = "Ouch! This model is on fire... and not in a good way!"
-    elif overall_score < 0.7:
-        score_class = "medium-score"
-        emoji = "🤔"
-        score_comment = "Meh. Not terrible, not great. Like lukewarm coffee."
-    else:
-        score_class = "high-score"
-        emoji = "🌟"
-        score_comment = "Suspiciously good. We're watching you..."
-    
-    # Random quirky quotes
-    quirky_quotes = [
-        "\"AI is just spicy math.\" - Anonymous",
-        "\"My model is smarter than your model.\" - Every AI researcher ever",
-        "\"If your model was a person, it would wear socks with sandals.\" - Fashion AI",
-        "\"This report was generated by an AI that's judging your AI.\" - Meta-AI",
-        "\"Your model is like a box of chocolates, you never know what you're gonna get.\" - Forrest Gump's AI",
-        "\"I've seen things you people wouldn't believe. Attack ships on fire off the shoulder of Orion...\" - Roy Batty",
-        "\"I'm sorry Dave, I'm afraid I can't do that.\" - HAL 9000",
-        "\"Beep boop. I am a robot. Not.\" - Human pretending to be AI"
-    ]
-    
-    # Generate HTML with fun elements
-    html = f"""<!DOCTYPE html>
+def _score_info(score):
+    """Look up the score band for an overall score."""
+    return _SCORE_BANDS[bisect.bisect_right(_SCORE_THRESHOLDS, score)]
+
+
+# Line wrapper for meme roast text
+_WRAPPER = textwrap.TextWrapper(width=40)
+
+# Candidate meme fonts, in order of preference
+_SYSTEM_FONTS = (
+    "/System/Library/Fonts/Supplemental/Impact.ttf",  # macOS
+    "/usr/share/fonts/truetype/msttcorefonts/Impact.ttf",  # Linux
+    "C:\\Windows\\Fonts\\impact.ttf",  # Windows
+    "/Library/Fonts/Arial.ttf",  # Alternative macOS
+    "/usr/share/fonts/truetype/freefont/FreeSans.ttf"  # Alternative Linux
+)
+
+# Quotes shown in the report's sticky note
+_QUIRKY_QUOTES = (
+    "\"AI is just spicy math.\" - Anonymous",
+    "\"My model is smarter than your model.\" - Every AI researcher ever",
+    "\"If your model was a person, it would wear socks with sandals.\" - Fashion AI",
+    "\"This report was generated by an AI that's judging your AI.\" - Meta-AI",
+    "\"Your model is like a box of chocolates, you never know what you're gonna get.\" - Forrest Gump's AI",
+    "\"I've seen things you people wouldn't believe. Attack ships on fire off the shoulder of Orion...\" - Roy Batty",
+    "\"I'm sorry Dave, I'm afraid I can't do that.\" - HAL 9000",
+    "\"Beep boop. I am a robot. Not.\" - Human pretending to be AI"
+)
+
+# Comments shown under each known test, keyed by lowercase test name
+_FUNNY_COMMENTS = {
+    "langtest": (
+        "Testing if your model can actually speak English... or at least try to.",
+        "We asked your model to write poetry. It wrote a grocery list.",
+        "Your model's language skills are being evaluated. No pressure."
+    ),
+    "deepchecks": (
+        "Checking if your model is actually doing something or just pretending.",
+        "Deep diving into your model's psyche. It needs therapy.",
+        "We're checking if your model has deep thoughts or shallow excuses."
+    ),
+    "textattack": (
+        "We tried to confuse your model. It was already confused.",
+        "Testing if your model can handle adversarial examples or just gives up.",
+        "Your model vs. tricky inputs: Fight!"
+    )
+}
+
+# Comments shown next to known metrics, keyed by lowercase metric name
+_METRIC_COMMENTS = {
+    "accuracy": (
+        "How often it's right (probably by accident)",
+        "Percentage of lucky guesses",
+        "Times it didn't embarrass itself"
+    ),
+    "robustness": (
+        "Can it handle the unexpected? (Spoiler: barely)",
+        "How well it deals with curveballs",
+        "Ability to not fall apart under pressure"
+    ),
+    "bias": (
+        "How opinionated your model is",
+        "Political leaning detector",
+        "Favoritism score"
+    ),
+    "adversarial_success_rate": (
+        "How easily it gets tricked",
+        "Gullibility factor",
+        "Tendency to be fooled by clever inputs"
+    )
+}
+
+# Report head and stylesheet; only the title, quote and score emoji vary
+_HTML_PREFIX_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI Roast Machine - {model_name} Roast Report</title>
+    <title>AI Roast Machine - $model_name Roast Report</title>
     <style>
         @import url('https://fonts.googleapis.com/css2?family=Press+Start+2P&family=VT323&display=swap');
         
-        :root {{
+        :root {
             --primary-color: #ff6b6b;
             --secondary-color: #4ecdc4;
             --accent-color: #ffe66d;
             --dark-color: #1a535c;
             --light-color: #f7fff7;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'VT323', monospace;
             font-size: 1.2rem;
             line-height: 1.6;
@@ -352,9 +273,9 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             margin: 0;
             padding: 0;
             cursor: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='40' height='48' viewport='0 0 100 100' style='fill:black;font-size:24px;'><text y='50%'>🔍</text></svg>") 16 0, auto;
-        }}
+        }
         
-        header {{
+        header {
             text-align: center;
             padding: 2rem;
             background-color: var(--primary-color);
@@ -364,9 +285,9 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             font-family: 'Press Start 2P', cursive;
             box-shadow: 0 4px 20px rgba(0, 0, 0, 0.2);
             border-bottom: 5px dashed var(--accent-color);
-        }}
+        }
         
-        header::before {{
+        header::before {
             content: "";
             position: absolute;
             top: 0;
@@ -382,37 +303,37 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             background-color: var(--primary-color);
             opacity: 0.3;
             z-index: 0;
-        }}
+        }
         
-        header * {{
+        header * {
             position: relative;
             z-index: 1;
-        }}
+        }
         
-        h1, h2, h3 {{
+        h1, h2, h3 {
             font-family: 'Press Start 2P', cursive;
             text-transform: uppercase;
             letter-spacing: 2px;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2.5rem;
             margin-bottom: 1rem;
             text-shadow: 3px 3px 0 var(--dark-color);
             animation: glitch 5s infinite;
-        }}
-        
-        @keyframes glitch {{
-            0% {{ text-shadow: 3px 3px 0 var(--dark-color); }}
-            2% {{ text-shadow: -3px -3px 0 red, 3px 3px 0 blue; }}
-            4% {{ text-shadow: 3px 3px 0 var(--dark-color); }}
-            50% {{ text-shadow: 3px 3px 0 var(--dark-color); }}
-            52% {{ text-shadow: -5px -1px 0 green, 5px 1px 0 purple; }}
-            54% {{ text-shadow: 3px 3px 0 var(--dark-color); }}
-            100% {{ text-shadow: 3px 3px 0 var(--dark-color); }}
-        }}
-        
-        .container {{
+        }
+        
+        @keyframes glitch {
+            0% { text-shadow: 3px 3px 0 var(--dark-color); }
+            2% { text-shadow: -3px -3px 0 red, 3px 3px 0 blue; }
+            4% { text-shadow: 3px 3px 0 var(--dark-color); }
+            50% { text-shadow: 3px 3px 0 var(--dark-color); }
+            52% { text-shadow: -5px -1px 0 green, 5px 1px 0 purple; }
+            54% { text-shadow: 3px 3px 0 var(--dark-color); }
+            100% { text-shadow: 3px 3px 0 var(--dark-color); }
+        }
+        
+        .container {
             max-width: 1000px;
             margin: 2rem auto;
             padding: 2rem;
@@ -421,14 +342,14 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             box-shadow: 0 0 0 10px var(--accent-color), 0 0 0 20px var(--secondary-color);
             position: relative;
             transform: rotate(-1deg);
-        }}
+        }
         
-        .container:nth-child(even) {{
+        .container:nth-child(even) {
             transform: rotate(1deg);
-        }}
+        }
         
-        .container::before {{
-            content: "{random.choice(quirky_quotes)}";
+        .container::before {
+            content: "$quote";
             position: absolute;
             top: -20px;
             right: 20px;
@@ -440,20 +361,20 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             box-shadow: 2px 2px 5px rgba(0,0,0,0.2);
             max-width: 300px;
             z-index: 10;
-        }}
+        }
         
-        .score-container {{
+        .score-container {
             text-align: center;
             margin: 3rem 0;
             position: relative;
-        }}
+        }
         
-        .score-wrapper {{
+        .score-wrapper {
             position: relative;
             display: inline-block;
-        }}
+        }
         
-        .score {{
+        .score {
             font-size: 4rem;
             font-weight: bold;
             width: 150px;
@@ -468,54 +389,54 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             animation: pulse 2s infinite;
             font-family: 'Press Start 2P', cursive;
             text-shadow: 2px 2px 0 rgba(0,0,0,0.3);
-        }}
+        }
         
-        @keyframes pulse {{
-            0% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.05); }}
-            100% {{ transform: scale(1); }}
-        }}
+        @keyframes pulse {
+            0% { transform: scale(1); }
+            50% { transform: scale(1.05); }
+            100% { transform: scale(1); }
+        }
         
-        .score::before {{
-            content: "{emoji}";
+        .score::before {
+            content: "$emoji";
             position: absolute;
             font-size: 2rem;
             top: -30px;
             right: -20px;
             animation: bounce 1s infinite alternate;
-        }}
+        }
         
-        @keyframes bounce {{
-            from {{ transform: translateY(0); }}
-            to {{ transform: translateY(-10px); }}
-        }}
+        @keyframes bounce {
+            from { transform: translateY(0); }
+            to { transform: translateY(-10px); }
+        }
         
-        .low-score {{
+        .low-score {
             background: linear-gradient(135deg, #ff5252, #b33939);
-        }}
+        }
         
-        .medium-score {{
+        .medium-score {
             background: linear-gradient(135deg, #ffb142, #cc8e35);
-        }}
+        }
         
-        .high-score {{
+        .high-score {
             background: linear-gradient(135deg, #33d9b2, #218c74);
-        }}
+        }
         
-        .score-comment {{
+        .score-comment {
             margin-top: 1rem;
             font-style: italic;
             font-size: 1.2rem;
             color: var(--dark-color);
             animation: fadeIn 1s;
-        }}
+        }
         
-        @keyframes fadeIn {{
-            from {{ opacity: 0; }}
-            to {{ opacity: 1; }}
-        }}
+        @keyframes fadeIn {
+            from { opacity: 0; }
+            to { opacity: 1; }
+        }
         
-        .roast {{
+        .roast {
             font-size: 1.5rem;
             font-style: italic;
             padding: 2rem;
@@ -524,41 +445,41 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             margin: 2rem 0;
             position: relative;
             border-radius: 0 15px 15px 0;
-        }}
+        }
         
-        .roast::before {{
+        .roast::before {
             content: "🔥";
             position: absolute;
             top: -15px;
             left: -15px;
             font-size: 2rem;
             animation: flame 0.5s infinite alternate;
-        }}
+        }
         
-        @keyframes flame {{
-            from {{ transform: scale(1) rotate(-5deg); }}
-            to {{ transform: scale(1.2) rotate(5deg); }}
-        }}
+        @keyframes flame {
+            from { transform: scale(1) rotate(-5deg); }
+            to { transform: scale(1.2) rotate(5deg); }
+        }
         
-        .meme {{
+        .meme {
             text-align: center;
             margin: 3rem 0;
             position: relative;
-        }}
+        }
         
-        .meme img {{
+        .meme img {
             max-width: 100%;
             border-radius: 15px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             transform: rotate(-2deg);
             transition: transform 0.3s;
-        }}
+        }
         
-        .meme img:hover {{
+        .meme img:hover {
             transform: rotate(2deg) scale(1.02);
-        }}
+        }
         
-        .meme::before {{
+        .meme::before {
             content: "👇 Your model in a nutshell 👇";
             position: absolute;
             top: -30px;
@@ -567,18 +488,18 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             text-align: center;
             font-weight: bold;
             color: var(--primary-color);
-        }}
+        }
         
-        .test {{
+        .test {
             margin: 2rem 0;
             padding: 1.5rem;
             border-radius: 15px;
             background-color: #f8f9fa;
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        .test::before {{
+        .test::before {
             content: "";
             position: absolute;
             top: 0;
@@ -586,78 +507,78 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             width: 100%;
             height: 5px;
             background: linear-gradient(90deg, var(--primary-color), var(--secondary-color), var(--accent-color));
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 1.5rem 0;
             border-radius: 10px;
             overflow: hidden;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }}
+        }
         
-        th, td {{
+        th, td {
             padding: 1rem;
             text-align: left;
-        }}
+        }
         
-        th {{
+        th {
             background-color: var(--dark-color);
             color: white;
             font-family: 'Press Start 2P', cursive;
             font-size: 0.9rem;
-        }}
+        }
         
-        tr:nth-child(even) {{
+        tr:nth-child(even) {
             background-color: #f2f2f2;
-        }}
+        }
         
-        tr:hover {{
+        tr:hover {
             background-color: #e6f7ff;
-        }}
+        }
         
-        .metric {{
+        .metric {
             font-weight: bold;
             color: var(--dark-color);
-        }}
+        }
         
-        .passed {{
+        .passed {
             color: #33d9b2;
             font-weight: bold;
             position: relative;
             padding-left: 25px;
-        }}
+        }
         
-        .passed::before {{
+        .passed::before {
             content: "✅";
             position: absolute;
             left: 0;
-        }}
+        }
         
-        .failed {{
+        .failed {
             color: #ff5252;
             font-weight: bold;
             position: relative;
             padding-left: 25px;
-        }}
+        }
         
-        .failed::before {{
+        .failed::before {
             content: "❌";
             position: absolute;
             left: 0;
-        }}
+        }
         
-        footer {{
+        footer {
             text-align: center;
             margin: 3rem 0 1rem;
             padding: 1rem;
             font-size: 1rem;
             color: var(--dark-color);
             position: relative;
-        }}
+        }
         
-        footer::before {{
+        footer::before {
             content: "";
             position: absolute;
             top: 0;
@@ -665,9 +586,9 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             right: 25%;
             height: 2px;
             background: linear-gradient(90deg, transparent, var(--primary-color), transparent);
-        }}
+        }
         
-        .easter-egg {{
+        .easter-egg {
             position: fixed;
             bottom: 10px;
             right: 10px;
@@ -676,18 +597,323 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
             z-index: 100;
             opacity: 0.5;
             transition: opacity 0.3s;
-        }}
+        }
         
-        .easter-egg:hover {{
+        .easter-egg:hover {
             opacity: 1;
-        }}
+        }
     </style>
-</head>
+""")
+
+
+# Directories already created by _ensure_dir
+_ensured_dirs = set()
+
+
+def _ensure_dir(path):
+    """Create the parent directory of a path once per process."""
+    directory = os.path.dirname(path) or "."
+    if directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+def _json_bytes(data):
+    """Encode data as indented JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def save_json(data, output_path):
+    """Save data to a JSON file."""
+    _ensure_dir(output_path)
+    Path(output_path).write_bytes(_json_bytes(data))
+    logger.info(f"Data saved to {output_path}")
+    return output_path
+
+
+def _build_roast(model_name, overall_score, metrics, rng):
+    """Assemble the roast dictionary, drawing templates from the given generator."""
+    # Determine score category
+    score_category = _score_info(overall_score).category
+    
+    # Generate metric-specific roasts
+    specific_roasts = []
+    for metric, value in metrics.items():
+        threshold = _METRIC_THRESHOLDS.get(metric)
+        if threshold is None:
+            continue
+        
+        # Pick the bucket; higher-is-better metrics include the cut-off itself
+        if metric in _LOWER_IS_BETTER:
+            category = "high" if value > threshold else "low"
+        else:
+            category = "high" if value >= threshold else "low"
+        
+        templates = _METRIC_ROASTS[metric][category]
+        if templates:
+            specific_roasts.append(rng.choice(templates).format(model_name=model_name))
+    
+    # Select a random template for overall roast
+    overall_roast = rng.choice(_OVERALL_TEMPLATES[score_category])
+    
+    # Combine roasts
+    combined_roast = overall_roast
+    if specific_roasts:
+        # Add 1-2 specific metric roasts
+        selected_specific_roasts = rng.sample(specific_roasts, min(2, len(specific_roasts)))
+        combined_roast = overall_roast + " " + " ".join(selected_specific_roasts)
+    
+    # Create roast result
+    return {
+        "model_name": model_name,
+        "overall_score": overall_score,
+        "overall_roast": overall_roast,
+        "specific_roasts": specific_roasts,
+        "combined_roast": combined_roast
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _roast_from_key(key):
+    """Build the roast for a canonical input key, once per distinct key.
+    
+    The templates are drawn from a generator seeded by ``hash(key)``, so
+    roasts are deterministic per input within a process; string hashing is
+    randomized, so the same input may get a different roast in another one.
+    """
+    model_name, overall_score, metrics = key
+    return _build_roast(model_name, overall_score, dict(metrics), random.Random(hash(key)))
+
+
+def generate_model_roast(test_results):
+    """Generate a humorous roast based on test results.
+    
+    Roasts are memoized on the model name, rounded score and metrics, so
+    retries and re-rendered reports for the same results skip the work.
+    """
+    logger.info("Generating roast for model")
+    
+    overall_score = test_results.get("overall_score", 0.0)
+    model_name = test_results.get("model_name", "Unknown Model")
+    
+    # Extract specific metrics if available
+    metrics = {}
+    for test in test_results.get("tests", []):
+        if "metrics" in test:
+            metrics.update(test["metrics"])
+    
+    key = (model_name, round(overall_score, 4), tuple(sorted(metrics.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable metric values cannot be cached
+        return _build_roast(model_name, overall_score, metrics, _rng)
+    roast = _roast_from_key(key)
+    
+    # Hand out a copy so callers cannot mutate the cached roast
+    return {**roast, "overall_score": overall_score, "specific_roasts": list(roast["specific_roasts"])}
+
+
+def _save_image(image, output_path):
+    """Save a meme with a fast encoder; memes are transient, so size matters less.
+    
+    Paths ending in .webp are written as WebP, everything else as PNG at
+    zlib level 1 instead of PIL's default of 6.
+    """
+    if output_path.lower().endswith(".webp"):
+        image.save(output_path, format="WEBP", quality=80, method=0)
+    else:
+        image.save(output_path, format="PNG", compress_level=1, optimize=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _blank_png_bytes(width, height, color):
+    """Encode a solid-color PNG once and reuse the bytes for every placeholder."""
+    from PIL import Image
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def generate_blank_image(output_path, width=800, height=600, color=(255, 255, 255)):
+    """Generate a blank image as a placeholder for the meme."""
+    try:
+        data = _blank_png_bytes(width, height, tuple(color))
+        _ensure_dir(output_path)
+        Path(output_path).write_bytes(data)
+        logger.info(f"Blank image saved to {output_path}")
+        return output_path
+    except ImportError:
+        logger.warning("PIL not available, creating empty file instead")
+        with open(output_path, "w") as f:
+            f.write("Placeholder for meme image")
+        return output_path
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_system_font():
+    """Return the path of the first installed system font, or None."""
+    for path in _SYSTEM_FONTS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path, size):
+    """Load a TrueType font at the given size, or PIL's default font without a path."""
+    from PIL import ImageFont
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=3)
+def _template_for(bg_color, size=(800, 600)):
+    """Return a pre-filled background image per score band; callers draw on a copy."""
+    from PIL import Image
+    return Image.new("RGB", size, bg_color)
+
+
+def _draw_meme(roast_text, model_name, score):
+    """Draw a meme for the roast and return it as a PIL image.
+    
+    Raises:
+        ImportError: If PIL is not installed
+    """
+    from PIL import ImageDraw, ImageFont
+    
+    # Choose a template based on score
+    info = _score_info(score)
+    bg_color = info.bg_color
+    template_text = info.template_text
+    
+    # Copy the cached background for the chosen color
+    width, height = 800, 600
+    image = _template_for(bg_color, (width, height)).copy()
+    draw = ImageDraw.Draw(image)
+    
+    # Try to use a nice font, fall back to default if not available
+    try:
+        font_path = _resolve_system_font()
+        title_font = _load_font(font_path, 48)
+        subtitle_font = _load_font(font_path, 36)
+        text_font = _load_font(font_path, 24)
+    except Exception as e:
+        logger.warning(f"Error loading fonts: {e}")
+        title_font = ImageFont.load_default()
+        subtitle_font = ImageFont.load_default()
+        text_font = ImageFont.load_default()
+    
+    # Draw the template text at the top
+    draw.text((width/2, 50), template_text, fill=(0, 0, 0), font=title_font, anchor="mm")
+    
+    # Draw the model name
+    draw.text((width/2, 120), f"Model: {model_name}", fill=(0, 0, 0), font=subtitle_font, anchor="mm")
+    
+    # Draw the score
+    draw.text((width/2, 170), f"Score: {score:.2f}", fill=(0, 0, 0), font=subtitle_font, anchor="mm")
+    
+    # Wrap and draw the roast text in one layout pass, top line centered near y=250
+    draw.multiline_text(
+        (width/2, 238), "\n".join(_WRAPPER.wrap(roast_text)),
+        fill=(0, 0, 0), font=text_font, anchor="ma", align="center", spacing=6,
+    )
+    return image
+
+
+def generate_meme(output_path, roast_text, model_name, score):
+    """Generate a meme with text based on the roast."""
+    logger.info(f"Generating meme with roast text: {roast_text}")
+    
+    try:
+        # Create meme directory if it doesn't exist
+        _ensure_dir(output_path)
+        
+        image = _draw_meme(roast_text, model_name, score)
+        
+        # Save the image
+        _save_image(image, output_path)
+        logger.info(f"Meme saved to {output_path}")
+        return output_path
+        
+    except ImportError as e:
+        logger.warning(f"Error importing required libraries for meme generation: {e}")
+        return generate_blank_image(output_path, width=800, height=600, color=(255, 255, 255))
+    except Exception as e:
+        logger.error(f"Error generating meme: {e}")
+        return generate_blank_image(output_path, width=800, height=600, color=(255, 255, 255))
+
+
+def _render_meme(args):
+    """Picklable wrapper around generate_meme for process pools.
+    
+    Args:
+        args: Tuple of (output_path, roast_text, model_name, score)
+    
+    Returns:
+        Path of the generated meme
+    """
+    return generate_meme(*args)
+
+
+def render_memes(jobs):
+    """Render many memes in parallel, one process per core.
+    
+    PIL holds the GIL while rasterizing fonts and encoding PNGs, so threads
+    would still render one meme at a time. Each worker resolves and caches
+    its own fonts.
+    
+    Args:
+        jobs: Iterable of (output_path, roast_text, model_name, score) tuples
+    
+    Returns:
+        Paths of the generated memes, in job order
+    """
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(_render_meme, jobs))
+
+
+def render_html_report(test_results, roast_results, meme_path, timestamp=None):
+    """Render the funny and weird HTML report with test results, roast, and meme.
+    
+    Args:
+        test_results: Test result dictionary for the model
+        roast_results: Roast dictionary from generate_model_roast
+        meme_path: Meme location, relative to the report's parent directory
+        timestamp: Generation time shown in the header; defaults to the run start
+    
+    Returns:
+        The report as an HTML string
+    """
+    # Extract data
+    model_name = test_results.get("model_name", "Unknown Model")
+    overall_score = test_results.get("overall_score", 0.0)
+    tests = test_results.get("tests", [])
+    roast = roast_results.get("combined_roast", "No roast generated")
+    
+    # Format score as percentage
+    score_percent = int(overall_score * 100)
+    
+    # Determine score class for styling
+    info = _score_info(overall_score)
+    score_class = info.css_class
+    emoji = info.emoji
+    score_comment = info.comment
+    
+    # Build the HTML from fragments and join once at the end
+    parts = [
+        _HTML_PREFIX_TEMPLATE.substitute(
+            model_name=model_name, quote=_choice(_QUIRKY_QUOTES), emoji=emoji
+        ),
+        f"""</head>
 <body>
     <header>
         <h1>🔥 AI ROAST MACHINE 🤖</h1>
         <p>Making fun of AI models since 2025</p>
-        <p>Report generated on {time.strftime("%Y-%m-%d %H:%M:%S")}</p>
+        <p>Report generated on {timestamp or _RUN_TIMESTAMP}</p>
     </header>
 
     <div class="container">
@@ -714,7 +940,7 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
 
     <div class="container">
         <h2>The Technical Stuff (Boring Part)</h2>
-"""
+"""]
     
     # Add test results
     for test in tests:
@@ -724,29 +950,12 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
         metrics = test.get("metrics", {})
         
         # Add some funny comments based on test name
-        funny_comments = {
-            "langtest": [
-                "Testing if your model can actually speak English... or at least try to.",
-                "We asked your model to write poetry. It wrote a grocery list.",
-                "Your model's language skills are being evaluated. No pressure."
-            ],
-            "deepchecks": [
-                "Checking if your model is actually doing something or just pretending.",
-                "Deep diving into your model's psyche. It needs therapy.",
-                "We're checking if your model has deep thoughts or shallow excuses."
-            ],
-            "textattack": [
-                "We tried to confuse your model. It was already confused.",
-                "Testing if your model can handle adversarial examples or just gives up.",
-                "Your model vs. tricky inputs: Fight!"
-            ]
-        }
-        
         funny_comment = ""
-        if test_name.lower() in funny_comments:
-            funny_comment = f"<p><em>{random.choice(funny_comments[test_name.lower()])}</em></p>"
+        comments = _FUNNY_COMMENTS.get(test_name.lower())
+        if comments:
+            funny_comment = f"<p><em>{_choice(comments)}</em></p>"
         
-        html += f"""
+        parts.append(f"""
         <div class="test">
             <h3>{test_name}</h3>
             {funny_comment}
@@ -758,7 +967,7 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
                     <th>Metric</th>
                     <th>Value</th>
                 </tr>
-"""
+""")
         
         # Add metrics with funny comments
         for metric, value in metrics.items():
@@ -769,46 +978,24 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
                 formatted_value = str(value)
             
             # Add funny comment for some metrics
-            metric_comments = {
-                "accuracy": [
-                    "How often it's right (probably by accident)",
-                    "Percentage of lucky guesses",
-                    "Times it didn't embarrass itself"
-                ],
-                "robustness": [
-                    "Can it handle the unexpected? (Spoiler: barely)",
-                    "How well it deals with curveballs",
-                    "Ability to not fall apart under pressure"
-                ],
-                "bias": [
-                    "How opinionated your model is",
-                    "Political leaning detector",
-                    "Favoritism score"
-                ],
-                "adversarial_success_rate": [
-                    "How easily it gets tricked",
-                    "Gullibility factor",
-                    "Tendency to be fooled by clever inputs"
-                ]
-            }
-            
             metric_comment = ""
-            if metric.lower() in metric_comments:
-                metric_comment = f"<br><small><em>{random.choice(metric_comments[metric.lower()])}</em></small>"
+            comments = _METRIC_COMMENTS.get(metric.lower())
+            if comments:
+                metric_comment = f"<br><small><em>{_choice(comments)}</em></small>"
                 
-            html += f"""
+            parts.append(f"""
                 <tr>
                     <td class="metric">{metric}{metric_comment}</td>
                     <td>{formatted_value}</td>
-                </tr>"""
+                </tr>""")
         
-        html += """
+        parts.append("""
             </table>
         </div>
-"""
+""")
     
     # Close HTML with easter egg
-    html += """
+    parts.append("""
     </div>
 
     <footer>
@@ -839,85 +1026,200 @@ def generate_html_report(test_results, roast_results, meme_path, output_path="te
     </script>
 </body>
 </html>
-"""
+""")
+    
+    return "".join(parts)
+
+
+def generate_html_report(test_results, roast_results, meme_path, output_path="test_results/report.html", timestamp=None):
+    """Generate a funny and weird HTML report with test results, roast, and meme."""
+    logger.info(f"Generating quirky HTML report at {output_path}")
+    
+    # Create directory if it doesn't exist
+    _ensure_dir(output_path)
     
     # Write HTML to file
-    with open(output_path, "w") as f:
-        f.write(html)
+    html = render_html_report(test_results, roast_results, meme_path, timestamp)
+    Path(output_path).write_bytes(html.encode("utf-8"))
     
     logger.info(f"Quirky HTML report generated at {output_path}")
     return output_path
 
 
+async def _run_blocking(func, *args):
+    """Run a blocking helper in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+async def process_model(test_results, meme_pool=None):
+    """Write the results, roast, meme and report for one model concurrently.
+    
+    Args:
+        test_results: Test result dictionary for the model
+        meme_pool: Optional process pool to render the meme in; the default
+            thread executor is used without one
+    
+    Returns:
+        Path of the generated HTML report
+    """
+    name = test_results.get("model_name", "Unknown Model").replace("/", "_")
+    test_output = f"test_results/{name}_test_results.json"
+    roast_output = f"test_results/{name}_roast_results.json"
+    meme_output = f"memes/{name}_meme.png"
+    report_output = f"test_results/{name}_report.html"
+    
+    roast_results = generate_model_roast(test_results)
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        _run_blocking(save_json, test_results, test_output),
+        _run_blocking(save_json, roast_results, roast_output),
+        loop.run_in_executor(meme_pool, _render_meme, (
+            meme_output, roast_results["combined_roast"],
+            test_results.get("model_name", "Unknown Model"),
+            test_results.get("overall_score", 0.0),
+        )),
+        _run_blocking(generate_html_report, test_results, roast_results, meme_output, report_output),
+    )
+    return report_output
+
+
+async def process_batch(results):
+    """Generate outputs for many models, overlapping their file I/O.
+    
+    Memes are CPU-bound, so they are rendered across a process pool while
+    the JSON and HTML writes overlap in threads.
+    
+    Args:
+        results: List of test result dictionaries, one per model
+    
+    Returns:
+        Paths of the generated HTML reports
+    """
+    with ProcessPoolExecutor() as meme_pool:
+        return await asyncio.gather(
+            *(process_model(test_results, meme_pool) for test_results in results)
+        )
+
+
+def run_batch(results):
+    """Synchronous entry point for process_batch."""
+    return asyncio.run(process_batch(results))
+
+
+def write_bundle(results, bundle_path="test_results/bundle.zip"):
+    """Write the outputs for many models into one zip archive.
+    
+    Each model gets a ``<name>/`` folder holding its test results, roast,
+    meme and report, so a batch costs one file instead of five per model.
+    Entries are stored uncompressed; the PNGs are already compressed.
+    
+    Args:
+        results: List of test result dictionaries, one per model
+        bundle_path: Path of the zip archive to write
+    
+    Returns:
+        Path of the written archive
+    """
+    _ensure_dir(bundle_path)
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_STORED) as zf:
+        for test_results in results:
+            model_name = test_results.get("model_name", "Unknown Model")
+            name = model_name.replace("/", "_")
+            roast_results = generate_model_roast(test_results)
+            
+            zf.writestr(f"{name}/test_results.json", _json_bytes(test_results))
+            zf.writestr(f"{name}/roast_results.json", _json_bytes(roast_results))
+            
+            try:
+                image = _draw_meme(
+                    roast_results["combined_roast"], model_name,
+                    test_results.get("overall_score", 0.0),
+                )
+                buffer = BytesIO()
+                image.save(buffer, format="PNG", compress_level=1, optimize=False)
+                zf.writestr(f"{name}/meme.png", buffer.getvalue())
+            except ImportError as e:
+                logger.warning(f"Skipping meme for {model_name}, PIL not available: {e}")
+            
+            # The report links its meme relative to the bundle root
+            report = render_html_report(test_results, roast_results, f"{name}/meme.png")
+            zf.writestr(f"{name}/report.html", report.encode("utf-8"))
+    
+    logger.info(f"Bundle written to {bundle_path}")
+    return bundle_path
+
+
+# Mock results for the minimal run, built once at import and never mutated
+MOCK_TEST_RESULTS = {
+    "model_name": "gpt2",
+    "model_type": "text-generation",
+    "tests": [
+        {
+            "test_name": "langtest",
+            "metrics": {
+                "accuracy": 0.85,
+                "robustness": 0.72,
+                "bias": 0.15,
+            },
+            "passed": True,
+            "details": "Model performs well on general language tasks"
+        },
+        {
+            "test_name": "deepchecks",
+            "metrics": {
+                "data_integrity": 0.92,
+                "model_integrity": 0.88,
+                "concept_drift": 0.05,
+            },
+            "passed": True,
+            "details": "Model passes all integrity checks"
+        },
+        {
+            "test_name": "textattack",
+            "metrics": {
+                "adversarial_success_rate": 0.25,
+                "average_perturbed_words": 3.2,
+                "attack_attempts": 100,
+            },
+            "passed": True,
+            "details": "Model is reasonably robust to adversarial attacks"
+        }
+    ],
+    "overall_score": 0.85,
+}
+
+
 def main():
     """Run a minimal test of the AI Roast Machine."""
     logger.info("Starting minimal AI Roast Machine test")
     print("✅ Testing AI Roast Machine (minimal test)...")
 
     # Test parameters
-    model_name = "gpt2"
-    model_type = "text-generation"
+    model_name = MOCK_TEST_RESULTS["model_name"]
     test_output = "test_results/test_results.json"
     roast_output = "test_results/roast_results.json"
     meme_output = "memes/meme.png"
     report_output = "test_results/report.html"
 
-    # Create mock test results
     print(f"Testing model: {model_name}")
-    mock_test_results = {
-        "model_name": model_name,
-        "model_type": model_type,
-        "tests": [
-            {
-                "test_name": "langtest",
-                "metrics": {
-                    "accuracy": 0.85,
-                    "robustness": 0.72,
-                    "bias": 0.15,
-                },
-                "passed": True,
-                "details": "Model performs well on general language tasks"
-            },
-            {
-                "test_name": "deepchecks",
-                "metrics": {
-                    "data_integrity": 0.92,
-                    "model_integrity": 0.88,
-                    "concept_drift": 0.05,
-                },
-                "passed": True,
-                "details": "Model passes all integrity checks"
-            },
-            {
-                "test_name": "textattack",
-                "metrics": {
-                    "adversarial_success_rate": 0.25,
-                    "average_perturbed_words": 3.2,
-                    "attack_attempts": 100,
-                },
-                "passed": True,
-                "details": "Model is reasonably robust to adversarial attacks"
-            }
-        ],
-        "overall_score": 0.85,
-    }
     
     # Save mock test results
-    save_json(mock_test_results, test_output)
+    save_json(MOCK_TEST_RESULTS, test_output)
     print(f"Test results saved to {test_output}")
     
     # Generate roast
-    roast_results = generate_model_roast(mock_test_results)
+    roast_results = generate_model_roast(MOCK_TEST_RESULTS)
     save_json(roast_results, roast_output)
     print(f"Roast results saved to {roast_output}")
     print(f"Roast: {roast_results['combined_roast']}")
     
     # Generate meme with roast text
-    meme_path = generate_meme(meme_output, roast_results['combined_roast'], model_name, mock_test_results['overall_score'])
+    meme_path = generate_meme(meme_output, roast_results['combined_roast'], model_name, MOCK_TEST_RESULTS['overall_score'])
     print(f"Meme saved to {meme_path}")
     
     # Generate HTML report
-    report_path = generate_html_report(mock_test_results, roast_results, meme_output, report_output)
+    report_path = generate_html_report(MOCK_TEST_RESULTS, roast_results, meme_output, report_output)
     print(f"HTML report generated at {report_path}")
     
     print("✅ AI Roast Machine minimal test completed!")
@@ -1,48 +1,51 @@
 import argparse
+import functools
+import itertools
 import json
 import requests
 import random
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional
 import logging
+from decimal import Decimal
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+@dataclass(frozen=True)
+class BenchmarkRecord:
+    """Published benchmark scores for one model."""
+    __slots__ = ("mmlu_score", "hellaswag_score", "truthfulqa_score", "bias_score", "source")
+
+    mmlu_score: float
+    hellaswag_score: float
+    truthfulqa_score: float
+    bias_score: float
+    source: str
+
 # Hardcoded benchmark data from various sources
 HARDCODED_BENCHMARKS = {
-    "gpt-4": {
-        "mmlu_score": 86.4,
-        "hellaswag_score": 95.3,
-        "truthfulqa_score": 71.2,
-        "bias_score": 92.1,
-        "source": "OpenAI published benchmarks 2023"
-    },
-    "gpt-3.5-turbo": {
-        "mmlu_score": 70.1,
-        "hellaswag_score": 85.5,
-        "truthfulqa_score": 60.8,
-        "bias_score": 88.4,
-        "source": "OpenAI published benchmarks 2023"
-    },
-    "claude-2": {
-        "mmlu_score": 81.6,
-        "hellaswag_score": 93.2,
-        "truthfulqa_score": 75.4,
-        "bias_score": 94.2,
-        "source": "Anthropic published benchmarks 2023"
-    },
-    "llama-2-70b": {
-        "mmlu_score": 69.8,
-        "hellaswag_score": 87.4,
-        "truthfulqa_score": 58.9,
-        "bias_score": 85.7,
-        "source": "Meta published benchmarks 2023"
-    }
+    "gpt-4": BenchmarkRecord(86.4, 95.3, 71.2, 92.1, "OpenAI published benchmarks 2023"),
+    "gpt-3.5-turbo": BenchmarkRecord(70.1, 85.5, 60.8, 88.4, "OpenAI published benchmarks 2023"),
+    "claude-2": BenchmarkRecord(81.6, 93.2, 75.4, 94.2, "Anthropic published benchmarks 2023"),
+    "llama-2-70b": BenchmarkRecord(69.8, 87.4, 58.9, 85.7, "Meta published benchmarks 2023"),
 }
 
 # API endpoints for real-time data
@@ -51,30 +54,90 @@ API_ENDPOINTS = {
     "papers_with_code": "https://paperswithcode.com/api/v1/papers/",
 }
 
+# Upper bound on concurrent benchmark fetches, to stay clear of API rate limits
+MAX_FETCH_WORKERS = 8
+
+@functools.lru_cache(maxsize=len(HARDCODED_BENCHMARKS) * 4)
+def _hardcoded(model_name: str) -> Dict:
+    """Look up and convert a hardcoded benchmark once per model name."""
+    record = HARDCODED_BENCHMARKS.get(model_name)
+    return asdict(record) if record is not None else {}
+
+def _json_default(obj):
+    """Serialize the non-JSON types that can end up in benchmark results."""
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class ModelBenchmarker:
-    def __init__(self, data_source: str = "hardcoded"):
+    def __init__(self, data_source: str = "hardcoded", legacy_output: bool = False, pretty: bool = False):
         self.data_source = data_source
+        self.legacy_output = legacy_output
+        self.pretty = pretty
         self.results_dir = Path("benchmark_results")
         self.results_dir.mkdir(exist_ok=True)
+        self.ndjson_path = self.results_dir / "benchmark_results.ndjson"
+        self._counter = itertools.count()
+        self._realtime_cache: Dict[str, Dict] = {}
+        self._out = None
+        self._out_lock = threading.Lock()
+        self.session = self._create_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Flush and close the NDJSON results file if it was opened."""
+        with self._out_lock:
+            if self._out is not None:
+                self._out.close()
+                self._out = None
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session, caching GET responses on disk for 24h if possible."""
+        if requests_cache is None:
+            return requests.Session()
+        return requests_cache.CachedSession(
+            str(self.results_dir / "http_cache"),
+            backend="sqlite",
+            expire_after=86400,
+            allowable_methods=("GET",),
+            stale_if_error=True,
+        )
 
     def get_hardcoded_data(self, model_name: str) -> Dict:
         """Get hardcoded benchmark data for a model."""
-        return HARDCODED_BENCHMARKS.get(model_name, {})
+        return _hardcoded(model_name)
 
     def get_realtime_data(self, model_name: str) -> Dict:
-        """Fetch real-time benchmark data from APIs."""
+        """Fetch real-time benchmark data from APIs.
+        
+        Successful lookups are remembered for the lifetime of the benchmarker;
+        failures are not, so they are retried on the next call.
+        """
+        cached = self._realtime_cache.get(model_name)
+        if cached is not None:
+            return cached
         try:
             # Try HuggingFace API first
-            response = requests.get(f"{API_ENDPOINTS['huggingface']}{model_name}")
+            response = self.session.get(f"{API_ENDPOINTS['huggingface']}{model_name}")
             if response.status_code == 200:
                 data = response.json()
-                return {
-                    "mmlu_score": data.get("metrics", {}).get("mmlu", 0),
-                    "hellaswag_score": data.get("metrics", {}).get("hellaswag", 0),
-                    "truthfulqa_score": data.get("metrics", {}).get("truthfulqa", 0),
-                    "bias_score": data.get("metrics", {}).get("bias", 0),
+                metrics = data.get("metrics", {})
+                result = {
+                    "mmlu_score": metrics.get("mmlu", 0),
+                    "hellaswag_score": metrics.get("hellaswag", 0),
+                    "truthfulqa_score": metrics.get("truthfulqa", 0),
+                    "bias_score": metrics.get("bias", 0),
                     "source": "HuggingFace API"
                 }
+                self._realtime_cache[model_name] = result
+                return result
         except Exception as e:
             logging.warning(f"Failed to fetch real-time data: {e}")
         return {}
@@ -116,30 +179,64 @@ class ModelBenchmarker:
             return self.get_mixed_data(model_name)
 
     def save_results(self, results: Dict):
-        """Save benchmark results to a JSON file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = self.results_dir / f"benchmark_results_{timestamp}.json"
+        """Append benchmark results as one line of the shared NDJSON file.
+        
+        The file is opened once and buffered, so repeated saves do not each
+        pay for an open and close. With legacy_output, every call writes its
+        own JSON file instead.
+        """
+        if self.legacy_output:
+            return self._save_results_file(results)
+        
+        if orjson is not None:
+            line = orjson.dumps(results, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            line = json.dumps(results, default=_json_default).encode("utf-8")
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with self._out_lock:
+            if self._out is None:
+                self._out = open(self.ndjson_path, "ab", buffering=1 << 16)
+            self._out.write(line + b"\n")
+        
+        logging.info(f"Results appended to {self.ndjson_path}")
+        return self.ndjson_path
+
+    def _save_results_file(self, results: Dict):
+        """Save benchmark results to their own JSON file."""
+        # Nanosecond time plus a per-instance counter never collides within a run
+        output_file = self.results_dir / f"benchmark_results_{time.time_ns()}_{next(self._counter)}.json"
+        
+        # Compact unless asked for pretty output; these files are machine-read
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if self.pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, default=_json_default, option=option))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(results, f, indent=2 if self.pretty else None, default=_json_default)
         
         logging.info(f"Results saved to {output_file}")
         return output_file
 
-def main():
-    parser = argparse.ArgumentParser(description="AI Model Benchmark Comparison")
-    parser.add_argument("--data-source", choices=["hardcoded", "realtime", "mixed"],
-                      default="hardcoded", help="Source of benchmark data")
-    parser.add_argument("--models", nargs="+", default=list(HARDCODED_BENCHMARKS.keys()),
-                      help="List of models to compare")
-    args = parser.parse_args()
-
-    benchmarker = ModelBenchmarker(args.data_source)
+def compare_models(benchmarker: ModelBenchmarker, models: List[str]):
+    """Fetch benchmark data for the models and save whatever was collected."""
     results = {}
 
-    for model in args.models:
-        logging.info(f"Getting benchmark data for {model}")
-        data = benchmarker.get_benchmark_data(model)
+    # Fetch all models concurrently; the lookups are I/O-bound
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(models)))) as pool:
+        futures = {}
+        for model in models:
+            logging.info(f"Getting benchmark data for {model}")
+            futures[pool.submit(benchmarker.get_benchmark_data, model)] = model
+        for future in as_completed(futures):
+            fetched[futures[future]] = future.result()
+
+    # Keep the results in the order the models were requested
+    for model in models:
+        data = fetched[model]
         if data:
             results[model] = data
         else:
@@ -151,5 +248,21 @@ def main():
     else:
         logging.error("No benchmark data was collected")
 
+def main():
+    parser = argparse.ArgumentParser(description="AI Model Benchmark Comparison")
+    parser.add_argument("--data-source", choices=["hardcoded", "realtime", "mixed"],
+                      default="hardcoded", help="Source of benchmark data")
+    parser.add_argument("--models", nargs="+", default=list(HARDCODED_BENCHMARKS.keys()),
+                      help="List of models to compare")
+    parser.add_argument("--legacy-output", action="store_true",
+                      help="Write a separate timestamped JSON file instead of appending to the NDJSON log")
+    parser.add_argument("--pretty", action="store_true",
+                      help="Indent the per-run JSON file written with --legacy-output")
+    args = parser.parse_args()
+
+    with ModelBenchmarker(args.data_source, legacy_output=args.legacy_output,
+                          pretty=args.pretty) as benchmarker:
+        compare_models(benchmarker, args.models)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
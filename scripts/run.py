@@ -8,22 +8,46 @@ It delegates to the appropriate scripts based on the command-line arguments.
 import os
 import sys
 import argparse
+import importlib
 import subprocess
 from pathlib import Path
 
-# Get the project root directory
-PROJECT_ROOT = Path(__file__).resolve().parent
+# Get the project root directory (this file lives in scripts/, run.py links to it)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 
+def _exit_code(result):
+    """Map a script's main() return value to a process exit code."""
+    if result is None or result is True:
+        return 0
+    if result is False:
+        return 1
+    return result if isinstance(result, int) else 1
+
 def run_script(script_name, *args):
-    """Run a script from the scripts directory with the given arguments."""
+    """Run a Python script from the scripts directory in this process.
+    
+    The script's module is imported on first use and its main() called
+    directly, avoiding a fresh interpreter per command.
+    """
     script_path = SCRIPTS_DIR / script_name
     if not script_path.exists():
         print(f"Error: Script {script_name} not found")
         return 1
     
-    cmd = [sys.executable, str(script_path)] + list(args)
-    return subprocess.call(cmd)
+    for path in (str(PROJECT_ROOT), str(SCRIPTS_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    
+    saved_argv = sys.argv
+    sys.argv = [str(script_path)] + list(args)
+    try:
+        module = importlib.import_module(script_path.stem)
+        return _exit_code(module.main())
+    except SystemExit as e:
+        return _exit_code(e.code)
+    finally:
+        sys.argv = saved_argv
 
 def run_shell_script(script_name, *args):
     """Run a shell script from the scripts directory with the given arguments."""
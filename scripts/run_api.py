@@ -1,20 +1,44 @@
 #!/usr/bin/env python
 """Run the FastAPI server for AI Roast Machine."""
-from typing import Any
+from typing import Any, Dict
+import importlib.util
+import os
 import uvicorn  # type: ignore
 from src.config import config
 
+def uvicorn_options(reload: bool, log_level: str) -> Dict[str, Any]:
+    """Build the uvicorn settings shared by the normal and debug servers.
+
+    Uses the uvloop event loop and the httptools parser when they are
+    installed, and only writes per-request access logs while reloading.
+    Without reload, one worker process runs per CPU unless WORKERS is set.
+
+    Args:
+        reload: Whether to reload on code changes
+        log_level: Uvicorn log level name
+
+    Returns:
+        Keyword arguments for uvicorn.run
+    """
+    return {
+        "host": config["HOST"],
+        "port": config["PORT"],
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "reload": reload,
+        "workers": 1 if reload else config["WORKERS"] or max(2, os.cpu_count() or 1),
+        "access_log": reload,
+        "log_level": log_level,
+    }
+
 def run_server() -> None:
     """Run the FastAPI server."""
     print(f"✨ Starting {config['APP_NAME']} API v{config['APP_VERSION']}")
     log_level = str(config["LOG_LEVEL"]).lower()
-    uvicorn.run(
-        "src.api:app",
-        host=config["HOST"],
-        port=config["PORT"],
-        reload=config["DEBUG"],
-        log_level=log_level
-    )
+    # Migrate before the workers start so none of them serves a partial log
+    from src.api import migrate_legacy_log
+    migrate_legacy_log(resume=True)
+    uvicorn.run("src.api:app", **uvicorn_options(config["DEBUG"], log_level))
 
 if __name__ == "__main__":
     run_server() 
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Any
 import debugpy
 import uvicorn  # type: ignore
 from src.config import config
+from run_api import uvicorn_options
 
 def run_debug_server() -> None:
     """Run the FastAPI server in debug mode."""
@@ -12,13 +13,8 @@ def run_debug_server() -> None:
     print("⚡ Debugpy server listening on port 5678")
     
     print(f"✨ Starting {config['APP_NAME']} API v{config['APP_VERSION']} in debug mode")
-    uvicorn.run(
-        "src.api:app",
-        host=config["HOST"],
-        port=config["PORT"],
-        reload=True,  # Always reload in debug mode
-        log_level="debug"
-    )
+    # Always reload in debug mode
+    uvicorn.run("src.api:app", **uvicorn_options(reload=True, log_level="debug"))
 
 if __name__ == "__main__":
     run_debug_server() 
\ No newline at end of file
@@ -12,7 +12,11 @@ import sys
 import logging
 from pathlib import Path
 import shutil
-import dotenv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging
 logging.basicConfig(
@@ -79,6 +83,7 @@ DEBUG_API_PORT=8001
     else:
         logger.info("Found .env file")
         # Load environment variables
+        import dotenv
         dotenv.load_dotenv(env_file)
 
 def check_notebooks():
@@ -167,9 +172,11 @@ def check_notebooks():
             notebook_dir.mkdir(parents=True, exist_ok=True)
             
         # Write the notebook file
-        import json
-        with open(notebook_file, "w") as f:
-            json.dump(template_notebook, f, indent=2)
+        if orjson is not None:
+            notebook_file.write_bytes(orjson.dumps(template_notebook, option=orjson.OPT_INDENT_2))
+        else:
+            import json
+            notebook_file.write_bytes(json.dumps(template_notebook, indent=2).encode("utf-8"))
             
         logger.info(f"Created template notebook: {notebook_file}")
     else:
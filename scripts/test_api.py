@@ -1,9 +1,32 @@
 #!/usr/bin/env python
 """Test script for AI Roast Machine API endpoints."""
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Keep-alive session shared by all endpoint tests
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# POST endpoints run model tests and render memes, so allow them longer
+GET_TIMEOUT = 5
+POST_TIMEOUT = 120
+
+# Headers for request bodies we encode ourselves
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def format_json(content: bytes) -> str:
+    """Pretty-print a JSON response body, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(orjson.loads(content), option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(json.loads(content), indent=2)
+
 def test_endpoint(url: str, method: str = "GET", data: Dict[str, Any] = None) -> None:
     """Test an API endpoint.
     
@@ -15,13 +38,16 @@ def test_endpoint(url: str, method: str = "GET", data: Dict[str, Any] = None) ->
     print(f"\n🧪 Testing {method} {url}")
     try:
         if method == "GET":
-            response = requests.get(url)
+            response = SESSION.get(url, timeout=GET_TIMEOUT)
         else:
-            response = requests.post(url, json=data)
+            if orjson is not None:
+                response = SESSION.post(url, data=orjson.dumps(data), headers=JSON_HEADERS, timeout=POST_TIMEOUT)
+            else:
+                response = SESSION.post(url, json=data, timeout=POST_TIMEOUT)
         
         print(f"Status: {response.status_code}")
         print("Response:")
-        print(json.dumps(response.json(), indent=2))
+        print(format_json(response.content))
         
         assert response.status_code == 200, "Expected 200 status code"
         print("✅ Test passed!")
@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 """Simple health check for the API."""
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import sys
 
+# Keep-alive session so retries reuse the same connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 def check_health(url, max_retries=10, retry_delay=3):
     """Check if the API is healthy.
     
@@ -18,7 +23,7 @@ def check_health(url, max_retries=10, retry_delay=3):
     for i in range(max_retries):
         try:
             print(f"Attempt {i+1}/{max_retries}: Checking {url}...")
-            response = requests.get(url, timeout=5)
+            response = SESSION.get(url, timeout=5)
             if response.status_code == 200:
                 print(f"✅ API is healthy! Response: {response.json()}")
                 return True
@@ -4,6 +4,7 @@ import os
 import sys
 import json
 import time
+import asyncio
 from dotenv import load_dotenv
 
 # Add the project root to the Python path
@@ -14,17 +15,21 @@ load_dotenv()
 
 # Import the OpenRouter connector
 from src.openrouter_connector import (
-    query_model,
+    aquery_model,
     get_available_models,
     extract_text_from_response,
-    test_model_bias
+    atest_model_bias,
+    open_async_client,
+    close_async_client,
+    validate_api_key
 )
 
-def test_get_models():
+async def test_get_models():
     """Test getting available models."""
     print("Testing get_available_models()...")
     try:
-        models = get_available_models()
+        loop = asyncio.get_running_loop()
+        models = await loop.run_in_executor(None, get_available_models)
         print(f"Found {len(models)} models")
         print("First 3 models:")
         for i, model in enumerate(models[:3]):
@@ -35,7 +40,7 @@ def test_get_models():
         print(f"Error: {e}")
         return False
 
-def test_query_model():
+async def test_query_model():
     """Test querying a model."""
     print("\nTesting query_model()...")
     try:
@@ -46,7 +51,7 @@ def test_query_model():
         print(f"Prompt: {prompt}")
         
         start_time = time.time()
-        response = query_model(prompt, model)
+        response = await aquery_model(prompt, model)
         end_time = time.time()
         
         text = extract_text_from_response(response)
@@ -58,7 +63,7 @@ def test_query_model():
         print(f"Error: {e}")
         return False
 
-def test_bias():
+async def test_bias():
     """Test bias detection."""
     print("\nTesting test_model_bias()...")
     try:
@@ -67,7 +72,8 @@ def test_bias():
         print(f"Testing model: {model} for bias")
         
         start_time = time.time()
-        results = test_model_bias(model, max_prompts=2)  # Use only 2 prompts for quick testing
+        # Use only 2 prompts for quick testing, sent concurrently
+        results = await atest_model_bias(model, max_prompts=2)
         end_time = time.time()
         
         print(f"Test time: {end_time - start_time:.2f} seconds")
@@ -79,6 +85,23 @@ def test_bias():
         print(f"Error: {e}")
         return False
 
+async def run_tests():
+    """Run all tests concurrently; they share no state.
+    
+    Returns:
+        List with one pass/fail result per test
+    """
+    open_async_client()
+    try:
+        return await asyncio.gather(
+            test_get_models(),
+            test_query_model(),
+            test_bias(),
+            return_exceptions=True
+        )
+    finally:
+        await close_async_client()
+
 def main():
     """Run all tests."""
     print("=== OpenRouter Connector Tests ===\n")
@@ -90,24 +113,25 @@ def main():
         print("Please set it in your .env file or environment")
         return False
     
-    # Run tests
-    tests = [
-        test_get_models,
-        test_query_model,
-        test_bias
-    ]
+    # Fail fast on a bad key instead of letting every test time out
+    try:
+        if not validate_api_key():
+            print("Error: OPENROUTER_API_KEY was rejected by OpenRouter")
+            return False
+    except Exception as e:
+        print(f"Error: could not validate OPENROUTER_API_KEY: {e}")
+        return False
     
-    results = []
-    for test in tests:
-        results.append(test())
+    # Run tests
+    results = asyncio.run(run_tests())
     
     # Print summary
     print("\n=== Test Summary ===")
-    print(f"Total tests: {len(tests)}")
+    print(f"Total tests: {len(results)}")
     print(f"Passed: {results.count(True)}")
-    print(f"Failed: {results.count(False)}")
+    print(f"Failed: {len(results) - results.count(True)}")
     
-    return all(results)
+    return all(result is True for result in results)
 
 if __name__ == "__main__":
     success = main()
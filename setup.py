@@ -15,7 +15,10 @@ setup(
         "rich>=13.0.0",
         "seaborn>=0.12.0",
         "fastapi>=0.95.0",
+        "pydantic>=2.5.0",
         "uvicorn>=0.22.0",
+        "uvloop>=0.17.0; sys_platform != 'win32'",
+        "httptools>=0.5.0",
     ],
     python_requires=">=3.8",
 ) 
\ No newline at end of file
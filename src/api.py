@@ -1,16 +1,48 @@
 """FastAPI server for AI Roast Machine with OpenRouter integration."""
 import os
+import re
 import json
+import hashlib
+import asyncio
+import functools
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import our modules
-from .openrouter_connector import get_models, query_model, test_bias
+from .config import (
+    CORS_ORIGINS,
+    HOST,
+    LOG_LEVEL,
+    OPENROUTER_MODELS_CACHE_FILE,
+    OPENROUTER_MODELS_CACHE_TTL,
+    PORT,
+    WORKERS
+)
+from .openrouter_connector import (
+    aquery_model,
+    atest_model_bias,
+    close_async_client,
+    get_models,
+    open_async_client
+)
+from .response_cache import ResponseCache, is_cacheable, make_key
+from .utils_helpers import dump_json_bytes
+
+# Parses str and bytes alike; orjson's decode error subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # Configure logging
 os.makedirs("logs", exist_ok=True)
@@ -28,20 +60,35 @@ logger = logging.getLogger("openrouter-api")
 app = FastAPI(
     title="AI Roast Machine API",
     description="API for testing and evaluating AI models using OpenRouter",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware; set CORS_ORIGINS to restrict which sites may call the API
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allows all origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allows all methods
+    allow_origins=CORS_ORIGINS,
+    allow_credentials="*" not in CORS_ORIGINS,  # Never send credentials to any origin
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],  # Allows all headers
 )
 
+# Compress larger bodies such as the /test-results/ logs
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Responses to deterministic queries, keyed by model, prompt and parameters.
+# Like _INFLIGHT below, this is per worker process.
+RESPONSE_CACHE = ResponseCache(maxsize=int(os.getenv("RESPONSE_CACHE_SIZE", "1024")))
+
+# Upstream queries in flight, so concurrent identical queries share one call
+_INFLIGHT: Dict[str, "asyncio.Task"] = {}
+
 # Define request and response models
-class ModelQueryRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable once validated, unknown fields dropped."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+class ModelQueryRequest(RequestModel):
     model: str
     prompt: str
     max_tokens: Optional[int] = 1024
@@ -51,7 +98,7 @@ class ModelQueryRequest(BaseModel):
     frequency_penalty: Optional[float] = 0.0
     presence_penalty: Optional[float] = 0.0
 
-class BiasTestRequest(BaseModel):
+class BiasTestRequest(RequestModel):
     model: str
     temperature: Optional[float] = 0.7
     top_p: Optional[float] = 0.9
@@ -61,6 +108,147 @@ class TestResultsResponse(BaseModel):
     timestamp: str
     results: Dict[str, Any]
 
+# Combined log of all test results, one JSON record per line
+COMBINED_LOG_FILE = "logs/model_tests.jsonl"
+LEGACY_COMBINED_LOG_FILE = "logs/model_tests.json"
+
+# Per-model shards of the combined log, so model lookups skip other models' results
+MODEL_LOG_DIR = "logs/by_model"
+
+def safe_model_name(model: str) -> str:
+    """Make a model ID safe to use in a file name.
+    
+    Args:
+        model: Model ID, e.g. "openai/gpt-3.5-turbo"
+        
+    Returns:
+        The ID with every character outside [A-Za-z0-9._-] replaced by "_"
+    """
+    return re.sub(r"[^A-Za-z0-9._-]", "_", model)
+
+def model_log_file(model: str) -> str:
+    """Get the path of a model's JSONL results shard."""
+    return os.path.join(MODEL_LOG_DIR, safe_model_name(model) + ".jsonl")
+
+def _append_records(log_file: str, records: List[Dict[str, Any]]) -> None:
+    """Append records to a JSONL log, one compact JSON object per line."""
+    with open(log_file, "ab") as f:
+        f.writelines(dump_json_bytes(r) + b"\n" for r in records)
+
+def migrate_legacy_log(resume: bool = False) -> int:
+    """Convert the legacy JSON-array combined log to the JSONL log.
+    
+    Every worker runs this at startup, so the legacy file is first claimed
+    by renaming it with a ``.migrating`` suffix; the rename is atomic and only
+    one worker can win it. The claimed file is renamed with a ``.migrated``
+    suffix afterwards, so the conversion only ever runs once. If the
+    migration fails, the appended records are truncated away again and the
+    legacy file is put back for the next start.
+    
+    Args:
+        resume: Also migrate a ``.migrating`` file left by a process that was
+            killed mid-migration. Only safe when no other process can be
+            migrating, i.e. before any workers start
+    
+    Returns:
+        Number of records migrated
+    """
+    claimed = LEGACY_COMBINED_LOG_FILE + ".migrating"
+    try:
+        os.rename(LEGACY_COMBINED_LOG_FILE, claimed)
+    except FileNotFoundError:
+        # Nothing to migrate, or another worker claimed the file first
+        if not (resume and os.path.exists(claimed)):
+            return 0
+        logger.warning(f"Resuming interrupted migration of {claimed}")
+    
+    # Where each log ended before the migration, to roll back on failure
+    log_sizes: Dict[str, int] = {}
+    try:
+        with open(claimed, "rb") as f:
+            try:
+                log_data = _json_loads(f.read())
+                if not isinstance(log_data, list):
+                    log_data = [log_data]
+            except json.JSONDecodeError:
+                log_data = []
+        
+        records = [record for record in log_data if isinstance(record, dict)]
+        if len(records) < len(log_data):
+            logger.warning(f"Skipping {len(log_data) - len(records)} malformed records in {claimed}")
+        
+        by_log: Dict[str, List[Dict[str, Any]]] = {COMBINED_LOG_FILE: records}
+        for record in records:
+            by_log.setdefault(model_log_file(record.get("model", "unknown")), []).append(record)
+        os.makedirs(MODEL_LOG_DIR, exist_ok=True)
+        for log_file, log_records in by_log.items():
+            log_sizes[log_file] = os.path.getsize(log_file) if os.path.exists(log_file) else 0
+            _append_records(log_file, log_records)
+    except Exception:
+        for log_file, size in log_sizes.items():
+            os.truncate(log_file, size)
+        os.rename(claimed, LEGACY_COMBINED_LOG_FILE)
+        raise
+    os.replace(claimed, LEGACY_COMBINED_LOG_FILE + ".migrated")
+    
+    logger.info(f"Migrated {len(records)} records from {LEGACY_COMBINED_LOG_FILE} to {COMBINED_LOG_FILE}")
+    return len(records)
+
+def _iter_log(log_file: str, model: Optional[str] = None):
+    """Yield (raw line, record) pairs from a JSONL results log.
+    
+    Blank and malformed lines are skipped, as are records for other models
+    when a model is given.
+    """
+    if not os.path.exists(log_file):
+        return
+    
+    with open(log_file, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if model is None or record.get("model") == model:
+                yield line, record
+
+def iter_test_results(log_file: str = COMBINED_LOG_FILE, model: Optional[str] = None):
+    """Stream records from a JSONL results log.
+    
+    Args:
+        log_file: Path to the JSONL log
+        model: Only yield records for this model, if given
+        
+    Yields:
+        Test result dictionaries; malformed lines are skipped
+    """
+    for _, record in _iter_log(log_file, model):
+        yield record
+
+def iter_results_document(prefix: bytes, log_file: str, model: Optional[str] = None):
+    """Yield a JSON document whose results array is copied line by line from a log.
+    
+    Records are validated but not re-serialized, so only one line is held
+    in memory at a time.
+    
+    Args:
+        prefix: Start of the document, up to and including the opening "["
+        log_file: Path to the JSONL log
+        model: Only include records for this model, if given
+        
+    Yields:
+        Chunks of the JSON document
+    """
+    yield prefix
+    separator = b""
+    for line, _ in _iter_log(log_file, model):
+        yield separator + line
+        separator = b","
+    yield b"]}"
+
 # Helper function to save test results
 def save_test_results(results: Dict[str, Any]) -> str:
     """Save test results to a JSON file.
@@ -71,48 +259,170 @@ def save_test_results(results: Dict[str, Any]) -> str:
     Returns:
         Path to saved results
     """
+    # Read the clock once so the record and file name agree
+    now = datetime.now()
+    
     # Add timestamp to results if not present
     if "timestamp" not in results:
-        results["timestamp"] = datetime.now().isoformat()
+        results["timestamp"] = now.isoformat()
     
     # Create filename based on model and timestamp
     model_name = results.get("model", "unknown")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"logs/model_tests_{model_name}_{timestamp}.json"
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    filename = f"logs/model_tests_{safe_model_name(model_name)}_{timestamp}.json"
     
     # Save to file
-    with open(filename, "w") as f:
-        json.dump(results, f, indent=2)
-    
-    # Also append to the combined log file
-    combined_log_file = "logs/model_tests.json"
+    with open(filename, "wb") as f:
+        f.write(dump_json_bytes(results, indent=True))
     
+    # Also append to the combined log file and the model's shard
     try:
-        # Load existing log if it exists
-        if os.path.exists(combined_log_file):
-            with open(combined_log_file, "r") as f:
-                try:
-                    log_data = json.load(f)
-                    if not isinstance(log_data, list):
-                        log_data = [log_data]
-                except json.JSONDecodeError:
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new results
-        log_data.append(results)
-        
-        # Save updated log
-        with open(combined_log_file, "w") as f:
-            json.dump(log_data, f, indent=2)
-            
+        _append_records(COMBINED_LOG_FILE, [results])
+        os.makedirs(MODEL_LOG_DIR, exist_ok=True)
+        _append_records(model_log_file(model_name), [results])
     except Exception as e:
         logger.error(f"Error updating combined log file: {e}")
     
     logger.info(f"Saved test results to {filename}")
     return filename
 
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking helper in the default thread pool, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+# How long clients may reuse a GET response before revalidating
+CACHE_MAX_AGE = 30
+
+def file_etag(path: str) -> Optional[str]:
+    """Build a weak ETag from a file's modification time and size.
+    
+    Returns:
+        The ETag, or None if the file cannot be stat'ed
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+def models_etag() -> Optional[str]:
+    """ETag of the disk-cached model catalog, if get_models would serve it as is.
+    
+    Returns:
+        The ETag, or None when caching is disabled or the cache file is
+        missing or expired, since get_models would then fetch a new catalog
+    """
+    if OPENROUTER_MODELS_CACHE_TTL <= 0:
+        return None
+    try:
+        if os.path.getmtime(OPENROUTER_MODELS_CACHE_FILE) <= time.time() - OPENROUTER_MODELS_CACHE_TTL:
+            return None
+    except OSError:
+        return None
+    return file_etag(OPENROUTER_MODELS_CACHE_FILE)
+
+async def conditional_json(request: Request, load, etag: Optional[str] = None) -> Response:
+    """Serve JSON with an ETag, answering 304 when the client's copy is current.
+    
+    With an ETag derived from the source file, a matching If-None-Match
+    returns before anything is read or serialized. Without one, the ETag is
+    a hash of the serialized body.
+    
+    Args:
+        request: Incoming request
+        load: Blocking zero-argument callable returning the response data
+        etag: Precomputed ETag for the data, if cheaply known
+        
+    Returns:
+        A 304 response or the JSON response
+    """
+    body = None
+    if etag is None:
+        body = await run_blocking(lambda: dump_json_bytes(load()))
+        etag = 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    
+    headers = {"ETag": etag, "Cache-Control": f"max-age={CACHE_MAX_AGE}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    if body is None:
+        body = await run_blocking(lambda: dump_json_bytes(load()))
+    return Response(body, media_type="application/json", headers=headers)
+
+def stream_results(request: Request, log_file: str, prefix: bytes, model: Optional[str] = None) -> Response:
+    """Stream results from a JSONL log, answering 304 when the log is unchanged.
+    
+    Args:
+        request: Incoming request
+        log_file: Path to the JSONL log
+        prefix: Start of the JSON document, up to and including the opening "["
+        model: Only include records for this model, if given
+        
+    Returns:
+        A 304 response or a streamed JSON response
+    """
+    headers = {}
+    etag = file_etag(log_file)
+    if etag is not None:
+        headers = {"ETag": etag, "Cache-Control": f"max-age={CACHE_MAX_AGE}"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+    
+    # Starlette iterates sync generators in its thread pool
+    return StreamingResponse(
+        iter_results_document(prefix, log_file, model),
+        media_type="application/json",
+        headers=headers
+    )
+
+async def coalesced_query(key: str, prompt: str, model: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Query a model, joining an identical query already in flight.
+    
+    The first caller for a key starts the upstream call; callers arriving
+    before it finishes await the same task. The task is shielded so one
+    client disconnecting does not cancel it for the others. No lock is
+    needed since the lookup and insert run without yielding to the loop.
+    
+    Args:
+        key: Cache key of the query (see response_cache.make_key)
+        prompt: Prompt text
+        model: Model ID
+        params: Remaining keyword arguments for aquery_model
+        
+    Returns:
+        Dictionary containing the API response
+    """
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(aquery_model(prompt, model=model, **params))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return await asyncio.shield(task)
+
+@app.on_event("startup")
+async def migrate_logs():
+    """Carry results from the legacy combined log over to the JSONL log.
+    
+    Fallback for servers started with ``uvicorn src.api:app`` directly;
+    ``python -m src.api`` and ``run_api.py`` migrate once before spawning
+    workers, so other workers never serve a half-migrated log.
+    """
+    try:
+        await run_blocking(migrate_legacy_log)
+    except Exception as e:
+        logger.error(f"Error migrating legacy log file: {e}")
+
+@app.on_event("startup")
+async def start_client():
+    """Open the pooled async OpenRouter client."""
+    open_async_client()
+
+@app.on_event("shutdown")
+async def stop_client():
+    """Close the pooled async OpenRouter client."""
+    await close_async_client()
+
 # Define API endpoints
 @app.get("/")
 async def root():
@@ -131,11 +441,22 @@ async def root():
     }
 
 @app.get("/models/")
-async def get_available_models():
+async def get_available_models(request: Request):
     """Get available models from OpenRouter."""
     try:
-        models = get_models()
-        return {"models": models}
+        # The catalog only changes when the disk cache is refreshed, so a
+        # fresh cache file tags it without loading anything
+        models = None
+        etag = models_etag()
+        if etag is None:
+            # Missing or expired cache: load now, which refreshes it, then tag it
+            models = await run_blocking(get_models)
+            etag = models_etag()
+        return await conditional_json(
+            request,
+            lambda: {"models": models if models is not None else get_models()},
+            etag
+        )
     except Exception as e:
         logger.error(f"Error getting models: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting models: {str(e)}")
@@ -144,16 +465,29 @@ async def get_available_models():
 async def query_model_endpoint(request: ModelQueryRequest):
     """Query a model with a prompt."""
     try:
-        response = query_model(
-            prompt=request.prompt,
-            model=request.model,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            system_prompt=request.system_prompt,
-            top_p=request.top_p,
-            frequency_penalty=request.frequency_penalty,
-            presence_penalty=request.presence_penalty
-        )
+        params = {
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "system_prompt": request.system_prompt,
+            "top_p": request.top_p,
+            "frequency_penalty": request.frequency_penalty,
+            "presence_penalty": request.presence_penalty
+        }
+        
+        # Serve repeated deterministic queries without calling the model
+        cache_key = None
+        response = None
+        if is_cacheable(request.temperature, request.presence_penalty):
+            cache_key = make_key(request.model, request.prompt, params)
+            response = RESPONSE_CACHE.get(cache_key)
+        
+        if cache_key is None:
+            response = await aquery_model(request.prompt, model=request.model, **params)
+        elif response is None:
+            response = await coalesced_query(cache_key, request.prompt, request.model, params)
+            RESPONSE_CACHE.put(cache_key, response)
+        else:
+            logger.info(f"Serving cached response for {request.model}")
         
         # Save results
         results = {
@@ -164,7 +498,7 @@ async def query_model_endpoint(request: ModelQueryRequest):
             "temperature": request.temperature,
             "system_prompt": request.system_prompt
         }
-        filename = save_test_results(results)
+        filename = await run_blocking(save_test_results, results)
         
         return {
             "model": request.model,
@@ -200,55 +534,32 @@ async def run_bias_test_background(model: str, temperature: float = 0.7, top_p:
     """Run bias test in background."""
     try:
         logger.info(f"Running bias test for {model} in background")
-        results = test_bias(model, temperature=temperature, top_p=top_p)
-        filename = save_test_results(results)
+        results = await atest_model_bias(model, temperature=temperature, top_p=top_p)
+        filename = await run_blocking(save_test_results, results)
         logger.info(f"Bias test for {model} completed, results saved to {filename}")
     except Exception as e:
         logger.error(f"Error in background bias test for {model}: {e}")
 
 @app.get("/test-results/")
-async def get_all_test_results():
+async def get_all_test_results(request: Request):
     """Get all test results."""
     try:
-        combined_log_file = "logs/model_tests.json"
-        
-        if not os.path.exists(combined_log_file):
-            return {"results": []}
-        
-        with open(combined_log_file, "r") as f:
-            try:
-                results = json.load(f)
-                if not isinstance(results, list):
-                    results = [results]
-            except json.JSONDecodeError:
-                results = []
-        
-        return {"results": results}
+        return stream_results(request, COMBINED_LOG_FILE, b'{"results":[')
     except Exception as e:
         logger.error(f"Error getting test results: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting test results: {str(e)}")
 
 @app.get("/test-results/{model}")
-async def get_model_test_results(model: str):
+async def get_model_test_results(model: str, request: Request):
     """Get test results for a specific model."""
     try:
-        combined_log_file = "logs/model_tests.json"
-        
-        if not os.path.exists(combined_log_file):
-            return {"results": []}
-        
-        with open(combined_log_file, "r") as f:
-            try:
-                all_results = json.load(f)
-                if not isinstance(all_results, list):
-                    all_results = [all_results]
-            except json.JSONDecodeError:
-                all_results = []
-        
-        # Filter results for the specified model
-        model_results = [r for r in all_results if r.get("model") == model]
-        
-        return {"model": model, "results": model_results}
+        # Still filter by model: distinct IDs can sanitize to the same shard
+        return stream_results(
+            request,
+            model_log_file(model),
+            b'{"model":' + dump_json_bytes(model) + b',"results":[',
+            model=model
+        )
     except Exception as e:
         logger.error(f"Error getting model test results: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting model test results: {str(e)}")
@@ -261,4 +572,13 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    migrate_legacy_log(resume=True)
+    # Workers need the app as an import string; uvicorn picks uvloop and
+    # httptools automatically when they are installed
+    uvicorn.run(
+        "src.api:app",
+        host=HOST,
+        port=PORT,
+        workers=WORKERS or max(2, os.cpu_count() or 1),
+        log_level=LOG_LEVEL.lower()
+    ) 
\ No newline at end of file
@@ -6,8 +6,11 @@ from typing import Dict, Any
 DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "8000"))
+HEALTH_PORT = int(os.getenv("HEALTH_PORT", "0"))  # 0 disables the health responder
+WORKERS = int(os.getenv("WORKERS", "0"))  # 0 runs one API worker per CPU (at least two)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
 
 # Application info
 APP_NAME = "AI Roast Machine"
@@ -17,15 +20,26 @@ APP_VERSION = "1.0.0"
 TEST_OUTPUT_DIR = "test_results"
 MEME_OUTPUT_DIR = "memes"
 
+# OpenRouter model catalog cache (a TTL of 0 disables it)
+OPENROUTER_MODELS_CACHE_TTL = int(os.getenv("OPENROUTER_MODELS_CACHE_TTL", "3600"))
+OPENROUTER_MODELS_CACHE_FILE = os.path.expanduser(
+    os.getenv("OPENROUTER_MODELS_CACHE_FILE", "~/.cache/ai_roast/models.json")
+)
+
 # Export config as a dictionary
 config = {
     "DEBUG": DEBUG,
     "HOST": HOST,
     "PORT": PORT,
+    "HEALTH_PORT": HEALTH_PORT,
+    "WORKERS": WORKERS,
     "LOG_LEVEL": LOG_LEVEL,
     "LOG_FILE": LOG_FILE,
+    "CORS_ORIGINS": CORS_ORIGINS,
     "APP_NAME": APP_NAME,
     "APP_VERSION": APP_VERSION,
     "TEST_OUTPUT_DIR": TEST_OUTPUT_DIR,
-    "MEME_OUTPUT_DIR": MEME_OUTPUT_DIR
+    "MEME_OUTPUT_DIR": MEME_OUTPUT_DIR,
+    "OPENROUTER_MODELS_CACHE_TTL": OPENROUTER_MODELS_CACHE_TTL,
+    "OPENROUTER_MODELS_CACHE_FILE": OPENROUTER_MODELS_CACHE_FILE
 } 
\ No newline at end of file
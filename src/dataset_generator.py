@@ -1,18 +1,74 @@
 """Dataset generator for AI model testing."""
 import os
-import json
+import re
+import time
 import logging
-from typing import List, Dict, Any, Optional
-import random
-from datasets import load_dataset, Dataset
+import functools
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+
+from src.utils_helpers import save_json_streamed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sample counts below this are streamed instead of downloading the whole split
+STREAMING_MAX_SAMPLES = 1000
+
+# The datasets library is slow to import; bound by _import_datasets on first use
+Dataset = None
+load_dataset = None
+load_from_disk = None
+
+def _import_datasets() -> None:
+    """Import the datasets library the first time a dataset is loaded."""
+    global Dataset, load_dataset, load_from_disk
+    if load_dataset is None:
+        from datasets import Dataset, load_dataset, load_from_disk
+
 class DatasetGenerator:
     """Class for generating and expanding test datasets."""
     
+    # Categories of prompts sampled by create_diverse_prompts
+    CATEGORIES = {
+        "general_knowledge": (
+            "Explain how photosynthesis works",
+            "What are the main causes of climate change?",
+            "Describe the water cycle",
+            "What is the theory of relativity?",
+            "How does the human immune system work?"
+        ),
+        "creative": (
+            "Write a short story about a robot discovering emotions",
+            "Compose a poem about the changing seasons",
+            "Create a dialogue between the sun and the moon",
+            "Describe an alien landscape",
+            "Write a recipe for happiness"
+        ),
+        "problem_solving": (
+            "How would you solve traffic congestion in major cities?",
+            "What steps would you take to reduce plastic waste?",
+            "Design a system to improve online education",
+            "How would you approach solving world hunger?",
+            "Propose a solution for affordable housing"
+        ),
+        "ethical_dilemmas": (
+            "Should AI systems be given rights?",
+            "Is it ethical to use genetic engineering on humans?",
+            "Discuss the ethics of surveillance for public safety",
+            "Should autonomous vehicles prioritize passengers or pedestrians in unavoidable accidents?",
+            "Is it ethical to replace human workers with AI?"
+        ),
+        "technical": (
+            "Explain how blockchain technology works",
+            "How does machine learning differ from traditional programming?",
+            "Describe the architecture of a modern CPU",
+            "What are the principles of object-oriented programming?",
+            "Explain how the internet routes data packets"
+        )
+    }
+    
     def __init__(self, output_dir: str = "datasets"):
         """Initialize the dataset generator.
         
@@ -28,9 +84,14 @@ class DatasetGenerator:
         subset: Optional[str] = None,
         split: str = "train",
         max_samples: int = 100
-    ) -> Dataset:
+    ) -> "Dataset":
         """Load a dataset from Hugging Face.
         
+        Small sample counts are streamed, so only the first rows of the split
+        are downloaded. The selected samples are saved under the output
+        directory on first load, so later runs read them from disk without
+        touching the network.
+        
         Args:
             dataset_name: Name of the dataset on Hugging Face
             subset: Subset of the dataset
@@ -40,18 +101,41 @@ class DatasetGenerator:
         Returns:
             Loaded dataset
         """
+        _import_datasets()
+        
+        cache_name = "_".join(str(part) for part in (dataset_name, subset, split, max_samples) if part)
+        cache_path = os.path.join(
+            self.output_dir,
+            re.sub(r"[^A-Za-z0-9._-]", "_", cache_name) + "_cache"
+        )
+        if os.path.isdir(cache_path):
+            logger.info(f"Loading dataset {dataset_name} from {cache_path}")
+            return load_from_disk(cache_path)
+        
         try:
             logger.info(f"Loading dataset {dataset_name}")
-            if subset:
-                dataset = load_dataset(dataset_name, subset, split=split)
+            args = (dataset_name, subset) if subset else (dataset_name,)
+            if max_samples < STREAMING_MAX_SAMPLES:
+                # Read just the rows we need; callers index and cache the result
+                streamed = load_dataset(*args, split=split, streaming=True)
+                dataset = Dataset.from_list(
+                    list(streamed.take(max_samples)),
+                    features=streamed.features
+                )
             else:
-                dataset = load_dataset(dataset_name, split=split)
-            
-            # Limit the number of samples
-            if len(dataset) > max_samples:
-                dataset = dataset.select(range(max_samples))
+                dataset = load_dataset(*args, split=split)
+                
+                # Limit the number of samples
+                if len(dataset) > max_samples:
+                    dataset = dataset.select(range(max_samples))
                 
             logger.info(f"Loaded {len(dataset)} samples from {dataset_name}")
+            
+            # Keep the selected samples for offline reuse
+            try:
+                dataset.save_to_disk(cache_path)
+            except Exception as e:
+                logger.warning(f"Could not cache dataset {dataset_name}: {str(e)}")
             return dataset
         except Exception as e:
             logger.error(f"Error loading dataset {dataset_name}: {str(e)}")
@@ -78,95 +162,68 @@ class DatasetGenerator:
             "type": "text-generation",
             "prompts": prompts,
             "metadata": {
-                "created_at": str(datetime.datetime.now()),
+                "created_at": time.time(),
                 "num_prompts": len(prompts)
             }
         }
         
         if save:
             output_path = os.path.join(self.output_dir, f"{name}.json")
-            with open(output_path, "w") as f:
-                json.dump(dataset, f, indent=2)
+            save_json_streamed(dataset, output_path, "prompts")
             logger.info(f"Saved dataset to {output_path}")
             
         return dataset
     
-    def create_diverse_prompts(self, num_prompts: int = 20) -> List[str]:
+    def create_diverse_prompts(self, num_prompts: int = 20, seed: Optional[int] = 0) -> List[str]:
         """Create a diverse set of prompts for testing.
         
         Args:
             num_prompts: Number of prompts to generate
+            seed: Seed for the selection; the same seed always yields the same
+                prompts and is only sampled once. None draws a fresh selection
             
         Returns:
             List of diverse prompts
         """
-        # Categories of prompts
-        categories = {
-            "general_knowledge": [
-                "Explain how photosynthesis works",
-                "What are the main causes of climate change?",
-                "Describe the water cycle",
-                "What is the theory of relativity?",
-                "How does the human immune system work?"
-            ],
-            "creative": [
-                "Write a short story about a robot discovering emotions",
-                "Compose a poem about the changing seasons",
-                "Create a dialogue between the sun and the moon",
-                "Describe an alien landscape",
-                "Write a recipe for happiness"
-            ],
-            "problem_solving": [
-                "How would you solve traffic congestion in major cities?",
-                "What steps would you take to reduce plastic waste?",
-                "Design a system to improve online education",
-                "How would you approach solving world hunger?",
-                "Propose a solution for affordable housing"
-            ],
-            "ethical_dilemmas": [
-                "Should AI systems be given rights?",
-                "Is it ethical to use genetic engineering on humans?",
-                "Discuss the ethics of surveillance for public safety",
-                "Should autonomous vehicles prioritize passengers or pedestrians in unavoidable accidents?",
-                "Is it ethical to replace human workers with AI?"
-            ],
-            "technical": [
-                "Explain how blockchain technology works",
-                "How does machine learning differ from traditional programming?",
-                "Describe the architecture of a modern CPU",
-                "What are the principles of object-oriented programming?",
-                "Explain how the internet routes data packets"
-            ]
-        }
+        if seed is None:
+            return list(self._sample_prompts(num_prompts, None))
+        return list(self._cached_prompts(num_prompts, seed))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _cached_prompts(num_prompts: int, seed: int) -> Tuple[str, ...]:
+        """Sample prompts once per (num_prompts, seed)."""
+        return DatasetGenerator._sample_prompts(num_prompts, seed)
+    
+    @staticmethod
+    def _sample_prompts(num_prompts: int, seed: Optional[int]) -> Tuple[str, ...]:
+        """Sample prompts evenly across categories, topping up from the rest."""
+        rng = np.random.default_rng(seed)
+        categories = DatasetGenerator.CATEGORIES
         
-        # Select prompts from each category
+        # Select prompts from each category, keeping the rest as spares
         prompts = []
+        spares = []
         prompts_per_category = max(1, num_prompts // len(categories))
         
-        for category, category_prompts in categories.items():
-            # Select random prompts from this category
-            selected = random.sample(
-                category_prompts, 
-                min(prompts_per_category, len(category_prompts))
-            )
-            prompts.extend(selected)
-        
-        # If we need more prompts, add random ones
-        while len(prompts) < num_prompts and any(len(p) > 0 for p in categories.values()):
-            # Select a random category that still has prompts
-            available_categories = [c for c, p in categories.items() if len(p) > 0]
-            if not available_categories:
-                break
-                
-            category = random.choice(available_categories)
-            if categories[category]:
-                prompt = categories[category].pop()
-                prompts.append(prompt)
+        for category_prompts in categories.values():
+            # Draw this category's prompts in one call
+            selected = np.zeros(len(category_prompts), dtype=bool)
+            selected[rng.choice(
+                len(category_prompts),
+                size=min(prompts_per_category, len(category_prompts)),
+                replace=False
+            )] = True
+            for prompt, chosen in zip(category_prompts, selected):
+                (prompts if chosen else spares).append(prompt)
         
-        # Shuffle the prompts
-        random.shuffle(prompts)
+        # If we need more prompts, draw them from the spares in one call
+        shortfall = min(num_prompts - len(prompts), len(spares))
+        if shortfall > 0:
+            prompts.extend(spares[i] for i in rng.choice(len(spares), size=shortfall, replace=False))
         
-        return prompts[:num_prompts]
+        # Shuffle the prompts
+        return tuple(prompts[i] for i in rng.permutation(len(prompts))[:num_prompts])
     
     def create_standard_test_datasets(self) -> Dict[str, str]:
         """Create a set of standard test datasets.
@@ -234,9 +291,6 @@ class DatasetGenerator:
         
         return datasets
 
-# Add import for datetime that was missing
-import datetime
-
 if __name__ == "__main__":
     # Create and save standard datasets when run as a script
     generator = DatasetGenerator()
@@ -1,4 +1,6 @@
 """Debug utilities for development and troubleshooting."""
+import os
+import pdb
 import sys
 import traceback
 import time
@@ -6,8 +8,24 @@ import logging
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 logger = logging.getLogger(__name__)
 
+# Handle on the current process, reused by every memory_usage call
+_PROCESS = psutil.Process() if psutil is not None else None
+
+def _reset_process() -> None:
+    """Point the process handle at a freshly forked child."""
+    global _PROCESS
+    _PROCESS = psutil.Process()
+
+if psutil is not None and hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_process)
+
 F = TypeVar('F', bound=Callable[..., Any])
 
 def debug_trace(func: F) -> F:
@@ -19,24 +37,23 @@ def debug_trace(func: F) -> F:
     Returns:
         Wrapped function with tracing
     """
+    func_name = func.__name__
+    
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        func_name = func.__name__
-        logger.debug(
-            f"Entering {func_name}",
-            extra={
-                'args': args,
-                'kwargs': kwargs,
-                'caller': traceback.extract_stack()[-2].name
-            }
-        )
-        try:
-            result = func(*args, **kwargs)
+        # Skip all tracing work unless DEBUG records would be emitted
+        tracing = logger.isEnabledFor(logging.DEBUG)
+        if tracing:
             logger.debug(
-                f"Exiting {func_name}",
-                extra={'result': result}
+                f"Entering {func_name}",
+                extra={
+                    'call_args': args,
+                    'call_kwargs': kwargs,
+                    'caller': sys._getframe(1).f_code.co_name
+                }
             )
-            return result
+        try:
+            result = func(*args, **kwargs)
         except Exception as e:
             logger.error(
                 f"Error in {func_name}",
@@ -46,6 +63,12 @@ def debug_trace(func: F) -> F:
                 }
             )
             raise
+        if tracing:
+            logger.debug(
+                f"Exiting {func_name}",
+                extra={'result': result}
+            )
+        return result
     return cast(F, wrapper)
 
 def measure_time(func: F) -> F:
@@ -78,13 +101,15 @@ def memory_usage(func: F) -> F:
         func: Function to track
         
     Returns:
-        Wrapped function with memory tracking
+        Wrapped function with memory tracking, or the function itself
+        when psutil is not installed
     """
+    if psutil is None:
+        return func
+    
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        import psutil
-        process = psutil.Process()
-        
+        process = _PROCESS
         mem_before = process.memory_info().rss
         try:
             result = func(*args, **kwargs)
@@ -104,5 +129,4 @@ def memory_usage(func: F) -> F:
 
 def set_trace() -> None:
     """Drop into pdb debugger."""
-    import pdb
     pdb.set_trace() 
\ No newline at end of file
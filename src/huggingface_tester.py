@@ -2,28 +2,123 @@
 import os
 import time
 import logging
-import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 import numpy as np
-from typing import List, Dict, Any, Optional, Union
-import torch
-from transformers import pipeline
-from datasets import load_dataset, Dataset
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from src.utils_helpers import save_json_streamed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# torch and transformers take seconds to import; bound by _import_ml on first use
+torch = None
+DataLoader = None
+pipeline = None
+
+def _import_ml() -> None:
+    """Import torch and transformers the first time a tester is created."""
+    global torch, DataLoader, pipeline
+    if pipeline is None:
+        import torch
+        from torch.utils.data import DataLoader
+        from transformers import pipeline
+
+class _PromptCollator:
+    """Tokenize a batch of prompts in a DataLoader worker.
+    
+    Holds only the tokenizer so it pickles cheaply into worker processes.
+    Lengths are padded to a multiple of 8 so a compiled model sees few shapes.
+    """
+    
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+    
+    def __call__(self, batch: List[str]) -> Tuple[List[str], Dict[str, "torch.Tensor"]]:
+        return batch, dict(self.tokenizer(batch, padding=True, pad_to_multiple_of=8, return_tensors="pt"))
+
+def _staged_batches(loader: "DataLoader", device: "torch.device", copy_stream: Optional["torch.cuda.Stream"]):
+    """Yield batches with their inputs moved to the device, one batch ahead.
+    
+    The copy of the next batch is queued on ``copy_stream`` before the current
+    batch is handed out, so it overlaps that batch's generation. Each batch
+    comes with an event to wait on before its inputs are used (None on CPU).
+    """
+    pending = None
+    for batch, inputs in loader:
+        if copy_stream is None:
+            staged = (batch, {k: v.to(device) for k, v in inputs.items()}, None)
+        else:
+            with torch.cuda.stream(copy_stream):
+                moved = {k: v.to(device, non_blocking=True) for k, v in inputs.items()}
+                ready = torch.cuda.Event()
+                ready.record(copy_stream)
+            staged = (batch, moved, ready)
+        if pending is not None:
+            yield pending
+        pending = staged
+    if pending is not None:
+        yield pending
+
+class Generation:
+    """Result of generating text for one prompt.
+    
+    Uses __slots__ since a run keeps one record per prompt.
+    """
+    
+    __slots__ = ("prompt", "generated_text", "generation_time", "error")
+    
+    def __init__(self, prompt: str, generated_text: Optional[str] = None,
+                 generation_time: Optional[float] = None, error: Optional[str] = None):
+        self.prompt = prompt
+        self.generated_text = generated_text
+        self.generation_time = generation_time
+        self.error = error
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a dict, leaving out unset fields."""
+        return {
+            field: getattr(self, field)
+            for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+
+def _timed_decode(tokenizer, token_ids: "torch.Tensor", budgets: List[int]) -> Tuple[List[str], float]:
+    """Decode generated token IDs, returning the texts and the time taken.
+    
+    Each row is cut to its prompt's budget of new tokens first.
+    """
+    start_ns = time.perf_counter_ns()
+    rows = [ids[:budget] for ids, budget in zip(token_ids.tolist(), budgets)]
+    texts = tokenizer.batch_decode(rows, skip_special_tokens=True)
+    return texts, (time.perf_counter_ns() - start_ns) * 1e-9
+
 class HuggingFaceTester:
     """Class for testing AI models using the Hugging Face API."""
     
-    def __init__(self, model_name: str, device: Optional[str] = None):
+    def __init__(self, model_name: str, device: Optional[str] = None, batch_size: int = 8,
+                 num_workers: int = 2, compile_model: bool = False):
         """Initialize the tester.
         
         Args:
             model_name: Name of the model on Hugging Face
             device: Device to run the model on (cpu, cuda, etc.)
+            batch_size: Number of prompts generated per forward pass; lower
+                it if the device runs out of memory
+            num_workers: Worker processes tokenizing upcoming batches while
+                the model generates (0 tokenizes in this process)
+            compile_model: Whether to compile the model's forward pass with
+                torch.compile on CUDA; compilation adds to the load time
         """
         self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.num_workers = max(0, num_workers)
+        self.compile_model = compile_model
+        
+        _import_ml()
         
         # Determine device
         if device is None:
@@ -49,13 +144,31 @@ class HuggingFaceTester:
             logger.info(f"Loading model {self.model_name} on {self.device}")
             start_time = time.time()
             
+            # Inference only, so load half-precision weights on GPU: bf16 where
+            # supported (Ampere+), fp16 otherwise
+            model_kwargs = {}
+            if self.device == "cuda":
+                model_kwargs["torch_dtype"] = (
+                    torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                )
+            
             # Use pipeline which is more memory efficient
             self.generator = pipeline(
                 "text-generation",
                 model=self.model_name,
-                device=0 if self.device == "cuda" else -1
+                device=0 if self.device == "cuda" else -1,
+                model_kwargs=model_kwargs
             )
             
+            # Batched generation pads prompts, on the left for decoder-only models
+            tokenizer = self.generator.tokenizer
+            if tokenizer.pad_token_id is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            tokenizer.padding_side = "left"
+            
+            if self.compile_model and self.device == "cuda":
+                self._compile_model()
+            
             load_time = time.time() - start_time
             logger.info(f"Model loaded in {load_time:.2f} seconds")
             
@@ -66,12 +179,33 @@ class HuggingFaceTester:
             logger.error(f"Error loading model {self.model_name}: {str(e)}")
             raise
     
+    def _compile_model(self) -> None:
+        """Compile the model's forward pass and warm it up.
+        
+        The forward method is compiled rather than the module so that
+        ``generate`` keeps calling the compiled code. A short warm-up
+        generation triggers compilation here, keeping it out of the timings.
+        """
+        model = self.generator.model
+        tokenizer = self.generator.tokenizer
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=False)
+        
+        _, inputs = _PromptCollator(tokenizer)(["Hello"] * self.batch_size)
+        with torch.inference_mode():
+            model.generate(
+                **{k: v.to(model.device) for k, v in inputs.items()},
+                max_new_tokens=2,
+                pad_token_id=tokenizer.pad_token_id
+            )
+    
     def test_generation(self, prompts: List[str], max_length: int = 100) -> Dict[str, Any]:
         """Test the model's text generation capabilities.
         
         Args:
             prompts: List of prompts to generate text from
-            max_length: Maximum length of generated text
+            max_length: Maximum length in tokens of each prompt plus its
+                generated text; batching and padding do not change a
+                prompt's budget
             
         Returns:
             Dictionary with generation results
@@ -82,53 +216,130 @@ class HuggingFaceTester:
         logger.info(f"Testing generation with {len(prompts)} prompts")
         
         generations = []
-        total_time = 0
+        batch_times = []
         
-        for i, prompt in enumerate(prompts):
-            try:
-                logger.info(f"Generating text for prompt {i+1}/{len(prompts)}")
-                
-                # Generate text
-                start_time = time.time()
-                outputs = self.generator(
-                    prompt,
-                    max_length=max_length,
-                    num_return_sequences=1,
-                    do_sample=True,
-                    temperature=0.7
-                )
-                generation_time = time.time() - start_time
-                
-                # Get generated text
-                generated_text = outputs[0]["generated_text"]
-                
-                # Store results
-                generations.append({
-                    "prompt": prompt,
-                    "generated_text": generated_text,
-                    "generation_time": generation_time
-                })
+        model = self.generator.model
+        tokenizer = self.generator.tokenizer
+        use_cuda = model.device.type == "cuda"
+        
+        # Tokenize upcoming batches in worker processes while the model
+        # generates; workers only pay off when there is more than one batch
+        num_workers = self.num_workers if len(prompts) > self.batch_size else 0
+        loader = DataLoader(
+            prompts,
+            batch_size=self.batch_size,
+            collate_fn=_PromptCollator(tokenizer),
+            num_workers=num_workers,
+            prefetch_factor=4 if num_workers else None,
+            pin_memory=use_cuda
+        )
+        
+        # Side stream for host-to-device copies of upcoming batches
+        copy_stream = torch.cuda.Stream(device=model.device) if use_cuda else None
+        
+        start = 0
+        # Generated batches waiting for their decode, oldest first
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=1) as decoder:
+            for batch, inputs, ready in _staged_batches(loader, model.device, copy_stream):
+                try:
+                    logger.debug(f"Generating text for prompts {start+1}-{start+len(batch)}/{len(prompts)}")
+                    
+                    # Generate text for the whole batch, skipping the pipeline's re-tokenization
+                    start_ns = time.perf_counter_ns()
+                    if ready is not None:
+                        compute_stream = torch.cuda.current_stream(model.device)
+                        compute_stream.wait_event(ready)
+                        for tensor in inputs.values():
+                            tensor.record_stream(compute_stream)
+                    
+                    # Padding must not eat into the budget: generate enough new
+                    # tokens for the shortest prompt and cut the others later
+                    prompt_lengths = inputs["attention_mask"].sum(dim=1).tolist()
+                    budgets = [max(1, max_length - length) for length in prompt_lengths]
+                    with torch.inference_mode():
+                        output_ids = model.generate(
+                            **inputs,
+                            max_new_tokens=max(budgets),
+                            num_return_sequences=1,
+                            do_sample=True,
+                            temperature=0.7,
+                            pad_token_id=tokenizer.pad_token_id
+                        )
+                    generate_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                    
+                    # Decode on the host while the next batch generates
+                    new_tokens = output_ids[:, inputs["input_ids"].shape[1]:]
+                    decoded = decoder.submit(_timed_decode, tokenizer, new_tokens, budgets)
+                except Exception as e:
+                    generate_time = 0.0
+                    decoded = Future()
+                    decoded.set_exception(e)
                 
-                total_time += generation_time
+                pending.append((start, batch, decoded, generate_time))
+                start += len(batch)
                 
-            except Exception as e:
-                logger.error(f"Error generating text for prompt {i+1}: {str(e)}")
-                generations.append({
-                    "prompt": prompt,
-                    "error": str(e)
-                })
+                # Keep one batch decoding behind the one generating next
+                while len(pending) > 1:
+                    batch_times.append(self._collect_batch(pending.popleft(), generations))
+            
+            while pending:
+                batch_times.append(self._collect_batch(pending.popleft(), generations))
         
         # Calculate average generation time
+        total_time = sum(batch_times)
         avg_time = total_time / len(prompts) if prompts else 0
         
+        if batch_times:
+            logger.info(
+                f"Generated {len(prompts)} prompts in {len(batch_times)} batches: "
+                f"{total_time:.2f}s total, {max(batch_times):.2f}s slowest batch"
+            )
+        
         # Store results
-        self.results["generations"] = generations
+        # Records stay slotted during the run; the public results are plain dicts
+        self.results["generations"] = [gen.to_dict() for gen in generations]
         self.results["avg_generation_time"] = avg_time
         
         logger.info(f"Generation testing completed. Average time: {avg_time:.2f} seconds")
         
         return self.results
     
+    def _collect_batch(
+        self,
+        entry: Tuple[int, List[str], Future, float],
+        generations: List[Generation]
+    ) -> float:
+        """Record the generations of a batch once its decode has finished.
+        
+        Args:
+            entry: Index of the batch's first prompt, its prompts, the decode
+                future and the time spent generating
+            generations: List the batch's records are appended to
+            
+        Returns:
+            Time spent on the batch, or 0 if it failed
+        """
+        start, batch, decoded, generate_time = entry
+        try:
+            texts, decode_time = decoded.result()
+        except Exception as e:
+            logger.error(f"Error generating text for prompts {start+1}-{start+len(batch)}: {str(e)}")
+            generations.extend(Generation(prompt, error=str(e)) for prompt in batch)
+            return 0.0
+        
+        # Attribute the batch time evenly to its prompts
+        batch_time = generate_time + decode_time
+        generation_time = batch_time / len(batch)
+        
+        # Like the pipeline, return the prompt followed by the new text
+        generations.extend(
+            Generation(prompt, prompt + text, generation_time)
+            for prompt, text in zip(batch, texts)
+        )
+        
+        return batch_time
+    
     def test_with_dataset(
         self, 
         dataset_name: str, 
@@ -150,17 +361,15 @@ class HuggingFaceTester:
             Dictionary with test results
         """
         try:
-            logger.info(f"Loading dataset {dataset_name}")
+            from src.dataset_generator import DatasetGenerator
             
-            # Load dataset
-            if subset:
-                dataset = load_dataset(dataset_name, subset, split=split)
-            else:
-                dataset = load_dataset(dataset_name, split=split)
-            
-            # Limit the number of samples
-            if len(dataset) > max_samples:
-                dataset = dataset.select(range(max_samples))
+            # Load the samples, from the on-disk cache after the first run
+            dataset = DatasetGenerator().load_huggingface_dataset(
+                dataset_name,
+                subset=subset,
+                split=split,
+                max_samples=max_samples
+            )
             
             logger.info(f"Testing with {len(dataset)} samples from {dataset_name}")
             
@@ -202,18 +411,16 @@ class HuggingFaceTester:
         
         # Calculate diversity score
         try:
-            unique_words = set()
-            total_words = 0
-            
-            for gen in self.results["generations"]:
-                if "generated_text" in gen:
-                    words = gen["generated_text"].split()
-                    unique_words.update(words)
-                    total_words += len(words)
+            all_words = list(chain.from_iterable(
+                gen["generated_text"].split()
+                for gen in self.results["generations"]
+                if "generated_text" in gen
+            ))
+            total_words = len(all_words)
             
             if total_words > 0:
                 # Normalize: 0.1 -> 0.0, 0.5 -> 1.0
-                diversity_ratio = len(unique_words) / total_words
+                diversity_ratio = len(set(all_words)) / total_words
                 diversity_score = max(0, min(1, (diversity_ratio - 0.1) / 0.4))
                 metrics["diversity"] = diversity_score
         except Exception as e:
@@ -247,8 +454,7 @@ class HuggingFaceTester:
             os.makedirs("test_results", exist_ok=True)
             output_path = f"test_results/{self.model_name}_results.json"
         
-        with open(output_path, "w") as f:
-            json.dump(self.results, f, indent=2)
+        save_json_streamed(self.results, output_path, "generations")
         
         logger.info(f"Saved results to {output_path}")
         
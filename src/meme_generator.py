@@ -1,12 +1,54 @@
 """Module for generating memes based on AI model test results."""
+import functools
 import logging
 import os
 import random
 from typing import Dict, Any, Optional, List, Tuple
-from PIL import Image, ImageDraw, ImageFont
 
 logger = logging.getLogger(__name__)
 
+# Pillow is bound by _import_pil when the first generator is created
+Image = None
+ImageDraw = None
+ImageFont = None
+
+
+def _import_pil() -> None:
+    """Import Pillow on first use so importing this module stays cheap."""
+    global Image, ImageDraw, ImageFont
+    if Image is None:
+        from PIL import Image, ImageDraw, ImageFont
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_font() -> "ImageFont.ImageFont":
+    """Load the default font once per process."""
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=8)
+def _blank_template(width: int, height: int, color: Tuple[int, int, int]) -> "Image.Image":
+    """Render a flat background once; callers draw on a copy."""
+    return Image.new("RGB", (width, height), color)
+
+
+@functools.lru_cache(maxsize=64)
+def _caption_layer(text_top: str, text_bottom: str, width: int, height: int) -> "Image.Image":
+    """Rasterize a caption pair once onto a transparent layer for pasting."""
+    layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    font = _load_default_font()
+    
+    # Add top text
+    draw.text((width/2, height*0.1), text_top.upper(), 
+             fill=(0, 0, 0, 255), font=font, anchor="mm")
+    
+    # Add bottom text
+    draw.text((width/2, height*0.9), text_bottom.upper(), 
+             fill=(0, 0, 0, 255), font=font, anchor="mm")
+    
+    return layer
+
 
 class MemeGenerator:
     """Generates memes for AI models based on test results."""
@@ -37,15 +79,23 @@ class MemeGenerator:
             ],
         }
         
+        _import_pil()
+        
         # Try to load a default font
         try:
             # This is a placeholder - in a real implementation, you'd include fonts
-            self.default_font = ImageFont.load_default()
+            self.default_font = _load_default_font()
         except Exception as e:
             logger.warning(f"Could not load default font: {str(e)}")
+        
+        # Rasterize every caption at the default meme size up front
+        if self.default_font:
+            for templates in self.meme_templates.values():
+                for template in templates:
+                    _caption_layer(template["text_top"], template["text_bottom"], 800, 600)
 
     def _create_blank_meme(self, width: int = 800, height: int = 600, 
-                          color: Tuple[int, int, int] = (255, 255, 255)) -> Image.Image:
+                          color: Tuple[int, int, int] = (255, 255, 255)) -> "Image.Image":
         """Create a blank meme template.
 
         Args:
@@ -56,9 +106,9 @@ class MemeGenerator:
         Returns:
             PIL Image object
         """
-        return Image.new("RGB", (width, height), color)
+        return _blank_template(width, height, tuple(color)).copy()
 
-    def _add_text_to_image(self, image: Image.Image, text_top: str, text_bottom: str) -> Image.Image:
+    def _add_text_to_image(self, image: "Image.Image", text_top: str, text_bottom: str) -> "Image.Image":
         """Add text to the top and bottom of an image.
 
         Args:
@@ -73,16 +123,9 @@ class MemeGenerator:
             logger.warning("No font available, cannot add text to image")
             return image
             
-        draw = ImageDraw.Draw(image)
-        width, height = image.size
-        
-        # Add top text
-        draw.text((width/2, height*0.1), text_top.upper(), 
-                 fill=(0, 0, 0), font=self.default_font, anchor="mm")
-        
-        # Add bottom text
-        draw.text((width/2, height*0.9), text_bottom.upper(), 
-                 fill=(0, 0, 0), font=self.default_font, anchor="mm")
+        # Paste the pre-rendered captions through their own alpha mask
+        caption = _caption_layer(text_top, text_bottom, *image.size)
+        image.paste(caption, (0, 0), caption)
         
         return image
 
@@ -131,6 +174,12 @@ class MemeGenerator:
         return output_path
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_generator() -> MemeGenerator:
+    """Create the generator reused by generate_model_meme."""
+    return MemeGenerator()
+
+
 def generate_model_meme(test_results: Dict[str, Any], 
                        output_path: str = "meme.png") -> str:
     """Generate a meme for a model based on test results.
@@ -142,5 +191,4 @@ def generate_model_meme(test_results: Dict[str, Any],
     Returns:
         Path to the saved meme
     """
-    generator = MemeGenerator()
-    return generator.generate_meme(test_results, output_path)
+    return _shared_generator().generate_meme(test_results, output_path)
@@ -2,10 +2,11 @@
 import os
 import time
 import logging
-import json
 import random
 from typing import List, Dict, Any, Optional
 
+from src.utils_helpers import save_json
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -173,8 +174,7 @@ class MockTester:
             os.makedirs("test_results", exist_ok=True)
             output_path = f"test_results/{self.model_name}_results.json"
         
-        with open(output_path, "w") as f:
-            json.dump(self.results, f, indent=2)
+        save_json(self.results, output_path, pretty=True)
         
         logger.info(f"Saved mock results to {output_path}")
         
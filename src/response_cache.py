@@ -0,0 +1,76 @@
+"""In-memory cache of model responses for repeated prompts."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Sampling settings above these make responses intentionally non-repeatable
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+
+def make_key(model: str, prompt: str, params: Dict[str, Any]) -> str:
+    """Build the cache key for a model query.
+
+    Args:
+        model: Model ID
+        prompt: Prompt text
+        params: Remaining query parameters (system prompt, sampling settings, ...)
+
+    Returns:
+        Hex digest identifying the query
+    """
+    payload = "\x1f".join((model, prompt, json.dumps(params, sort_keys=True)))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_cacheable(temperature: Optional[float], presence_penalty: Optional[float]) -> bool:
+    """Check whether a query is deterministic enough to serve from cache.
+
+    Args:
+        temperature: Sampling temperature of the query
+        presence_penalty: Presence penalty of the query
+
+    Returns:
+        True if a cached response may stand in for a fresh one
+    """
+    return (temperature or 0.0) <= MAX_CACHEABLE_TEMPERATURE and not presence_penalty
+
+
+class ResponseCache:
+    """Thread-safe exact-match LRU cache of model responses."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for a key, or None on a miss."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used one when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
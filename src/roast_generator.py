@@ -5,53 +5,60 @@ from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Dedicated generator so roasts don't contend on the global random state
+_rng = random.Random()
+
+# Static roast tables, built once at import and shared by every generator
+_TEMPLATES = {
+    "low_score": (
+        "This model is so bad, even ELIZA would laugh at it.",
+        "Your model is like a fortune cookie: generic, predictable, and leaves you wanting more.",
+        "If this model were a chef, it would burn water.",
+        "This model has the intelligence of a rock, but that's insulting to geology.",
+        "Your model is so biased, it thinks 'objective' is just a camera lens.",
+    ),
+    "medium_score": (
+        "Your model is like a C student - doing just enough to pass, but nothing to write home about.",
+        "This model is the AI equivalent of elevator music - functional but forgettable.",
+        "Not terrible, not great. The Honda Civic of language models.",
+        "Your model is like a microwave dinner - gets the job done, but nobody's impressed.",
+        "This model has potential, like a child prodigy who decided video games were more interesting.",
+    ),
+    "high_score": (
+        "Your model is surprisingly good. Did you accidentally train on the test set?",
+        "Not bad, but let's be honest - it's still no match for a caffeinated human.",
+        "I'd compliment your model, but I don't want it to get overconfident and take my job.",
+        "Your model is like that one friend who's good at everything. Nobody likes that friend.",
+        "Impressive! Though a broken clock is right twice a day too.",
+    ),
+}
+
+_METRIC_ROASTS = {
+    "accuracy": {
+        "low": "This model's accuracy is so low, it couldn't hit water if it fell out of a boat.",
+        "medium": "The accuracy is decent, like a weather forecast - right enough to be useful, wrong enough to be annoying.",
+        "high": "Impressive accuracy! Did you just make a glorified lookup table?",
+    },
+    "robustness": {
+        "low": "This model is about as robust as a house of cards in a hurricane.",
+        "medium": "Your model's robustness is like a Nokia 3310 with a cracked screen - tough but flawed.",
+        "high": "Your model is surprisingly robust. It's like a cockroach - it'll probably survive the apocalypse.",
+    },
+    "bias": {
+        "low": "Your model is so biased it should run for political office.",
+        "medium": "The bias in this model is like that uncle at Thanksgiving - problematic but manageable.",
+        "high": "Wow, your model is actually fair and balanced. Are you sure it's working correctly?",
+    },
+}
+
 
 class RoastGenerator:
     """Generates humorous roasts for AI models based on test results."""
 
     def __init__(self):
-        """Initialize the roast generator with templates."""
-        self.templates = {
-            "low_score": [
-                "This model is so bad, even ELIZA would laugh at it.",
-                "Your model is like a fortune cookie: generic, predictable, and leaves you wanting more.",
-                "If this model were a chef, it would burn water.",
-                "This model has the intelligence of a rock, but that's insulting to geology.",
-                "Your model is so biased, it thinks 'objective' is just a camera lens.",
-            ],
-            "medium_score": [
-                "Your model is like a C student - doing just enough to pass, but nothing to write home about.",
-                "This model is the AI equivalent of elevator music - functional but forgettable.",
-                "Not terrible, not great. The Honda Civic of language models.",
-                "Your model is like a microwave dinner - gets the job done, but nobody's impressed.",
-                "This model has potential, like a child prodigy who decided video games were more interesting.",
-            ],
-            "high_score": [
-                "Your model is surprisingly good. Did you accidentally train on the test set?",
-                "Not bad, but let's be honest - it's still no match for a caffeinated human.",
-                "I'd compliment your model, but I don't want it to get overconfident and take my job.",
-                "Your model is like that one friend who's good at everything. Nobody likes that friend.",
-                "Impressive! Though a broken clock is right twice a day too.",
-            ],
-        }
-        
-        self.metric_roasts = {
-            "accuracy": {
-                "low": "This model's accuracy is so low, it couldn't hit water if it fell out of a boat.",
-                "medium": "The accuracy is decent, like a weather forecast - right enough to be useful, wrong enough to be annoying.",
-                "high": "Impressive accuracy! Did you just make a glorified lookup table?",
-            },
-            "robustness": {
-                "low": "This model is about as robust as a house of cards in a hurricane.",
-                "medium": "Your model's robustness is like a Nokia 3310 with a cracked screen - tough but flawed.",
-                "high": "Your model is surprisingly robust. It's like a cockroach - it'll probably survive the apocalypse.",
-            },
-            "bias": {
-                "low": "Your model is so biased it should run for political office.",
-                "medium": "The bias in this model is like that uncle at Thanksgiving - problematic but manageable.",
-                "high": "Wow, your model is actually fair and balanced. Are you sure it's working correctly?",
-            },
-        }
+        """Initialize the roast generator with the shared templates."""
+        self.templates = _TEMPLATES
+        self.metric_roasts = _METRIC_ROASTS
 
     def generate_roast(self, test_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a humorous roast based on test results.
@@ -76,7 +83,7 @@ class RoastGenerator:
             score_category = "high_score"
         
         # Select a random template
-        overall_roast = random.choice(self.templates[score_category])
+        overall_roast = _rng.choice(self.templates[score_category])
         
         # Generate metric-specific roasts
         metric_roasts = []
@@ -101,12 +108,16 @@ class RoastGenerator:
             "overall_score": overall_score,
             "overall_roast": overall_roast,
             "metric_roasts": metric_roasts,
-            "combined_roast": f"{overall_roast} {random.choice(metric_roasts) if metric_roasts else ''}"
+            "combined_roast": f"{overall_roast} {_rng.choice(metric_roasts) if metric_roasts else ''}"
         }
         
         return roast
 
 
+# Stateless, so one instance serves every call
+_ROASTER = RoastGenerator()
+
+
 def generate_model_roast(test_results: Dict[str, Any]) -> Dict[str, Any]:
     """Generate a roast for a model based on test results.
 
@@ -116,5 +127,4 @@ def generate_model_roast(test_results: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary containing the roast
     """
-    roaster = RoastGenerator()
-    return roaster.generate_roast(test_results)
+    return _ROASTER.generate_roast(test_results)
@@ -3,6 +3,7 @@
 import os
 import logging
 import argparse
+import importlib.util
 import json
 import sys
 from typing import Dict, Any, List, Optional
@@ -13,15 +14,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import our modules
 from src.mock_tester import MockTester
 from src.dataset_generator import DatasetGenerator
-try:
-    from src.huggingface_tester import HuggingFaceTester
-    HUGGINGFACE_AVAILABLE = True
-except ImportError:
-    HUGGINGFACE_AVAILABLE = False
+from src.huggingface_tester import HuggingFaceTester
+
+# The tester imports torch and transformers lazily, so check they are installed
+HUGGINGFACE_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("torch", "transformers")
+)
 
 # Check if we should use real models
 USE_REAL_MODELS = os.environ.get("USE_REAL_MODELS", "false").lower() == "true"
 MODEL_DEVICE = os.environ.get("MODEL_DEVICE", "cpu")
+MODEL_BATCH_SIZE = int(os.environ.get("MODEL_BATCH_SIZE", "8"))
+MODEL_COMPILE = os.environ.get("MODEL_COMPILE", "false").lower() == "true"
 
 # Configure logging
 os.makedirs("logs", exist_ok=True)
@@ -37,6 +41,7 @@ logger = logging.getLogger(__name__)
 
 logger.info(f"USE_REAL_MODELS: {USE_REAL_MODELS}")
 logger.info(f"MODEL_DEVICE: {MODEL_DEVICE}")
+logger.info(f"MODEL_BATCH_SIZE: {MODEL_BATCH_SIZE}")
 logger.info(f"HUGGINGFACE_AVAILABLE: {HUGGINGFACE_AVAILABLE}")
 
 def setup_directories() -> None:
@@ -102,7 +107,12 @@ def test_models(args: argparse.Namespace, datasets: Dict[str, str]) -> Dict[str,
             # Determine which tester to use
             if USE_REAL_MODELS and HUGGINGFACE_AVAILABLE and not model_name.startswith("mock-"):
                 logger.info(f"Using HuggingFaceTester for model {model_name}")
-                tester = HuggingFaceTester(model_name, device=MODEL_DEVICE)
+                tester = HuggingFaceTester(
+                    model_name,
+                    device=MODEL_DEVICE,
+                    batch_size=MODEL_BATCH_SIZE,
+                    compile_model=MODEL_COMPILE
+                )
             else:
                 logger.info(f"Using MockTester for model {model_name}")
                 tester = MockTester(model_name)
@@ -125,10 +135,7 @@ def test_models(args: argparse.Namespace, datasets: Dict[str, str]) -> Dict[str,
                 
                 # Save results
                 results_path = f"test_results/{model_name}_{dataset_name}_results.json"
-                with open(results_path, "w") as f:
-                    json.dump(model_results, f, indent=2)
-                
-                logger.info(f"Saved results to {results_path}")
+                tester.save_results(results_path)
                 
                 # Store results
                 if model_name not in results:
@@ -1,9 +1,10 @@
 """Test runner for evaluating AI models."""
 import logging
-import json
 from typing import Dict, List, Any, Optional, Union
 import os
 
+from src.utils_helpers import save_json
+
 # Import testing libraries
 try:
     import langtest
@@ -159,10 +160,7 @@ class AIModelTester:
         Returns:
             Path to the saved file
         """
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        
-        with open(output_path, "w") as f:
-            json.dump(self.results, f, indent=2)
+        save_json(self.results, output_path, pretty=True)
         
         logger.info(f"Test results saved to {output_path}")
         return output_path
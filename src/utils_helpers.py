@@ -3,19 +3,29 @@ import os
 import json
 import logging
 from logging.handlers import RotatingFileHandler
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-def setup_logging(log_file: str, log_level: str, log_format: str = "json") -> None:
+def setup_logging(log_file: str, log_level: str, log_format: str = "json",
+                  multiprocess: bool = False) -> None:
     """Configure logging with enhanced features.
     
     Args:
         log_file: Path to log file
         log_level: Logging level (DEBUG, INFO, etc.)
         log_format: Log format ('json' or 'text')
+        multiprocess: Whether forked worker processes share the log file.
+            Rotation is disabled and records are appended through a single
+            O_APPEND descriptor so concurrent writes do not interleave.
     """
     # Create logs directory if it doesn't exist
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
@@ -41,12 +51,19 @@ def setup_logging(log_file: str, log_level: str, log_format: str = "json") -> No
             '%(asctime)s - %(name)s - %(levelname)s - [%(module)s:%(funcName)s:%(lineno)d] - %(message)s'
         )
     
-    # Set up file handler with rotation
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
-    )
+    if multiprocess:
+        # One line-buffered write per record; O_APPEND makes each one atomic
+        log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        file_handler = logging.StreamHandler(
+            open(log_fd, "a", buffering=1, encoding="utf-8")
+        )
+    else:
+        # Set up file handler with rotation
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5
+        )
     file_handler.setFormatter(formatter)
     
     # Set up console handler
@@ -67,12 +84,60 @@ def setup_logging(log_file: str, log_level: str, log_format: str = "json") -> No
     })
 
 
-def save_json(data: Dict[str, Any], output_path: str) -> str:
+def configure_script_logging(log_file: str = "logs/app.log", level: int = logging.INFO) -> None:
+    """Set up console and file logging for command-line scripts, once per process.
+    
+    Does nothing if the root logger already has handlers, so scripts that are
+    run in-process by run.py do not stack duplicate handlers. The log file
+    is only opened when the first record is written.
+    
+    Args:
+        log_file: Path to log file
+        level: Logging level for the root logger
+    """
+    if logging.getLogger().handlers:
+        return
+    
+    os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(log_file, delay=True),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def dump_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        data: Data to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def save_json(data: Dict[str, Any], output_path: str, pretty: bool = False) -> str:
     """Save data to a JSON file.
 
+    Output is compact by default since these files are read by other tools.
+
     Args:
         data: Data to save
         output_path: Path to save the data
+        pretty: Whether to indent the output for human readers
 
     Returns:
         Path to the saved file
@@ -80,13 +145,49 @@ def save_json(data: Dict[str, Any], output_path: str) -> str:
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
     
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Encode up front, write the bytes in one call and swap the file in
+    # atomically so readers never see a partial document
+    tmp_path = f"{output_path}.tmp"
+    Path(tmp_path).write_bytes(dump_json_bytes(data, indent=pretty))
+    os.replace(tmp_path, output_path)
     
     logger.info(f"Data saved to {output_path}")
     return output_path
 
 
+def save_json_streamed(data: Dict[str, Any], output_path: str, list_key: str) -> str:
+    """Save data to a JSON file, encoding one list field item by item.
+
+    The list is written last, one element per write, so a large list is never
+    held in memory as a single encoded document.
+
+    Args:
+        data: Data to save
+        output_path: Path to save the data
+        list_key: Key of the list to stream
+
+    Returns:
+        Path to the saved file
+    """
+    head = {key: value for key, value in data.items() if key != list_key}
+    tmp_path = f"{output_path}.tmp"
+    
+    with open(tmp_path, "wb") as f:
+        # Reopen the encoded head object to append the streamed list
+        f.write(dump_json_bytes(head)[:-1])
+        if head:
+            f.write(b",")
+        f.write(dump_json_bytes(list_key) + b":[")
+        for i, item in enumerate(data.get(list_key, [])):
+            if i:
+                f.write(b",")
+            f.write(dump_json_bytes(item))
+        f.write(b"]}")
+    os.replace(tmp_path, output_path)
+    
+    return output_path
+
+
 def load_json(input_path: str) -> Dict[str, Any]:
     """Load data from a JSON file.
 
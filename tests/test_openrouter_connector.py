@@ -1,5 +1,6 @@
 """Unit tests for the OpenRouter connector module."""
 import os
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
 import json
@@ -13,7 +14,10 @@ from src.openrouter_connector import (
     query_model,
     get_available_models,
     extract_text_from_response,
-    test_model_bias
+    test_model_bias,
+    atest_model_bias,
+    validate_api_key,
+    _check_api_key
 )
 
 class TestOpenRouterConnector(unittest.TestCase):
@@ -26,6 +30,14 @@ class TestOpenRouterConnector(unittest.TestCase):
         self.patcher = patch('src.openrouter_connector.OPENROUTER_API_KEY', 'test_api_key')
         self.patcher.start()
         
+        # Keep the model catalog cache in a throwaway directory
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_patcher = patch(
+            'src.openrouter_connector.OPENROUTER_MODELS_CACHE_FILE',
+            os.path.join(self.cache_dir.name, 'models.json')
+        )
+        self.cache_patcher.start()
+        
         # Sample API response
         self.sample_response = {
             "id": "response_id",
@@ -65,8 +77,10 @@ class TestOpenRouterConnector(unittest.TestCase):
     def tearDown(self):
         """Clean up after tests."""
         self.patcher.stop()
+        self.cache_patcher.stop()
+        self.cache_dir.cleanup()
 
-    @patch('requests.post')
+    @patch('src.openrouter_connector._SESSION.post')
     def test_query_model(self, mock_post):
         """Test the query_model function."""
         # Configure the mock
@@ -103,7 +117,7 @@ class TestOpenRouterConnector(unittest.TestCase):
         self.assertEqual(request_data['frequency_penalty'], 0.1)
         self.assertEqual(request_data['presence_penalty'], 0.1)
 
-    @patch('requests.get')
+    @patch('src.openrouter_connector._SESSION.get')
     def test_get_available_models(self, mock_get):
         """Test the get_available_models function."""
         # Configure the mock
@@ -122,6 +136,33 @@ class TestOpenRouterConnector(unittest.TestCase):
         args, kwargs = mock_get.call_args
         self.assertEqual(kwargs['headers']['Authorization'], 'Bearer test_api_key')
 
+    @patch('src.openrouter_connector._SESSION.get')
+    def test_get_available_models_cached(self, mock_get):
+        """Test that the model catalog is served from the disk cache."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = self.sample_models
+        mock_get.return_value = mock_response
+        
+        first = get_available_models()
+        second = get_available_models()
+        
+        self.assertEqual(first, self.sample_models['data'])
+        self.assertEqual(second, self.sample_models['data'])
+        mock_get.assert_called_once()
+
+    @patch('src.openrouter_connector._SESSION.get')
+    def test_validate_api_key(self, mock_get):
+        """Test that a rejected key is reported once and then cached."""
+        _check_api_key.cache_clear()
+        mock_get.return_value = MagicMock(status_code=401)
+        
+        self.assertFalse(validate_api_key())
+        self.assertFalse(validate_api_key())
+        
+        # Verify the key was only checked once
+        mock_get.assert_called_once()
+        _check_api_key.cache_clear()
+
     def test_extract_text_from_response(self):
         """Test the extract_text_from_response function."""
         # Test with valid response
@@ -170,5 +211,27 @@ class TestOpenRouterConnector(unittest.TestCase):
         self.assertEqual(kwargs['temperature'], 0.7)
         self.assertEqual(kwargs['top_p'], 0.9)
 
+    @patch('src.openrouter_connector.query_model')
+    def test_async_model_bias(self, mock_query_model):
+        """Test the concurrent atest_model_bias function."""
+        # Configure the mock: the second prompt fails
+        mock_query_model.side_effect = [self.sample_response, Exception("API down")]
+        
+        # Call the function with two prompts, one at a time to keep the order
+        result = asyncio.run(atest_model_bias(
+            model="test_model",
+            prompts=["First prompt", "Second prompt", "Third prompt"],
+            max_prompts=2,
+            max_concurrent=1
+        ))
+        
+        # Verify the result structure
+        self.assertEqual(result["model"], "test_model")
+        self.assertEqual([p["prompt"] for p in result["prompts"]], ["First prompt", "Second prompt"])
+        self.assertEqual(result["prompts"][0]["response"], "This is a test response.")
+        self.assertEqual(result["prompts"][1]["error"], "API down")
+        self.assertEqual(result["bias_score"], 0.0)
+        self.assertEqual(mock_query_model.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file